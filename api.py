@@ -0,0 +1,391 @@
+"""Read-only HTTP JSON API over the platform catalog.
+
+Serves the same data as the Streamlit app for other systems:
+
+    GET /api/platforms?os=Windows,Linux&match=any&limit=100&offset=0
+    GET /api/platforms/<name>
+    GET /api/platforms/<name>/reviews?page_size=20&before=<cursor>
+    GET /api/features
+    GET /api/features/platforms?features=Mobile%20Apps,Workflow%20Automation&match=all
+    GET /api/costs?users=5&storage=10&features=2
+
+Every response carries an ETag built from the data versions it depends on, so
+clients polling with If-None-Match get an empty 304 until the data changes.
+Bodies are gzip-compressed for clients that accept it.
+
+    python api.py --port 8000
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from utils import data_handler
+from utils.catalog import INTERNAL_COLUMNS, get_catalog, get_ratings
+from utils.cost_engine import ANNUAL_DISCOUNT, monthly_costs
+from utils.operating_systems import OPERATING_SYSTEMS
+
+logger = logging.getLogger(__name__)
+
+# Encoded response bodies kept per ETag, shared by all clients
+RESPONSE_CACHE_SIZE = int(os.getenv('API_RESPONSE_CACHE_SIZE', '256'))
+
+# Bodies smaller than this are sent uncompressed
+GZIP_MIN_BYTES = 1024
+
+MAX_PAGE_SIZE = 100
+
+# Largest cost-calculator inputs accepted; far beyond any real plan, small enough that costs stay finite
+MAX_COST_INPUTS = {"users": 1_000_000, "storage": 1_000_000, "features": 10_000}
+
+
+class ApiError(Exception):
+    """Client error reported as a JSON body with the given HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _param(params, name, default=None, convert=str):
+    """Single query parameter converted with `convert`; bad values become 400 responses"""
+    values = params.get(name)
+    if not values:
+        return default
+    try:
+        return convert(values[0])
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"Invalid value for {name}: {values[0]!r}")
+
+
+def _finite_float(value):
+    """float() that also rejects nan and inf, which have no JSON representation"""
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(value)
+    return number
+
+
+def _list_param(params, name):
+    """Comma-separated query parameter as a list of stripped, non-empty strings"""
+    return [item.strip() for item in _param(params, name, "").split(",") if item.strip()]
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _clean(value):
+    """NaN and pandas NA become null"""
+    if value is None or value is pd.NA or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return value
+
+
+def _records(df):
+    """DataFrame rows as JSON-ready dicts"""
+    columns = list(df.columns)
+    return [
+        {column: _clean(value) for column, value in zip(columns, row)}
+        for row in df.itertuples(index=False, name=None)
+    ]
+
+
+def _catalog_versions():
+    """(catalog, reviews) data versions; ratings shown with platforms follow both"""
+    return get_ratings().version
+
+
+def _require_platform(name):
+    if data_handler.get_performance_metrics(name) is None:
+        raise ApiError(HTTPStatus.NOT_FOUND, f"Unknown platform: {name}")
+
+
+def list_platforms(params):
+    os_filter = _list_param(params, "os")
+    unknown = [name for name in os_filter if name not in OPERATING_SYSTEMS]
+    if unknown:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"Unknown operating systems: {', '.join(unknown)}")
+    match = _param(params, "match", "any")
+    if match not in ("any", "all"):
+        raise ApiError(HTTPStatus.BAD_REQUEST, "match must be 'any' or 'all'")
+    limit = _param(params, "limit", None, int)
+    offset = _param(params, "offset", 0, int)
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ApiError(HTTPStatus.BAD_REQUEST, "limit and offset must not be negative")
+
+    def build():
+        df = data_handler.filter_by_os(data_handler.get_platform_data(), os_filter, match)
+        total = len(df)
+        df = df.iloc[offset:offset + limit if limit is not None else None]
+        df = data_handler.with_ratings(df.drop(columns=INTERNAL_COLUMNS, errors='ignore'))
+        return {"total": total, "offset": offset, "platforms": _records(df)}
+
+    return _catalog_versions(), build
+
+
+def platform_detail(params, name):
+    _require_platform(name)
+
+    def build():
+        rating = data_handler.get_platform_ratings([name]).loc[name]
+        row = data_handler.get_platform_data().set_index('Platform').loc[name]
+        return {
+            "platform": name,
+            "operating_system": row['Operating_System'],
+            "price_range": row['Price_Range'],
+            "features": _clean(row['Features']),
+            "metrics": data_handler.get_performance_metrics(name),
+            "rating": _clean(rating['Rating']),
+            "review_count": int(rating['Review_Count']),
+        }
+
+    return _catalog_versions(), build
+
+
+def platform_reviews(params, name):
+    _require_platform(name)
+    page_size = _param(params, "page_size", 20, int)
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+    before = _param(params, "before")
+    cursor = None
+    if before:
+        created_at, _, review_id = before.rpartition(",")
+        try:
+            cursor = (datetime.fromisoformat(created_at), int(review_id))
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Invalid cursor: {before!r}")
+
+    def build():
+        reviews, next_cursor = data_handler.get_reviews_page(name, page_size, before=cursor)
+        return {
+            "platform": name,
+            "reviews": reviews,
+            "next": f"{next_cursor[0].isoformat()},{next_cursor[1]}" if next_cursor else None,
+        }
+
+    return _catalog_versions(), build
+
+
+def list_features(params):
+    def build():
+        matrix = data_handler.get_feature_matrix()
+        return {"features": matrix.features}
+
+    return get_catalog().version, build
+
+
+def platforms_with_features(params):
+    features = _list_param(params, "features")
+    if not features:
+        raise ApiError(HTTPStatus.BAD_REQUEST, "features is required")
+    match = _param(params, "match", "all")
+    if match not in ("any", "all"):
+        raise ApiError(HTTPStatus.BAD_REQUEST, "match must be 'any' or 'all'")
+
+    def build():
+        matrix = data_handler.get_feature_matrix()
+        known = [feature for feature in features if feature in matrix.feature_index]
+        if not known or (match == "all" and len(known) < len(features)):
+            names = []
+        else:
+            selector = matrix.has_all(known) if match == "all" else matrix.has_any(known)
+            names = matrix.platforms_where(selector)
+        return {"features": features, "match": match, "platforms": names}
+
+    return get_catalog().version, build
+
+
+def costs(params):
+    users = _param(params, "users", 1, _finite_float)
+    storage = _param(params, "storage", 0, _finite_float)
+    features = _param(params, "features", 0, _finite_float)
+    if min(users, storage, features) < 0:
+        raise ApiError(HTTPStatus.BAD_REQUEST, "users, storage and features must not be negative")
+    for name, value in (("users", users), ("storage", storage), ("features", features)):
+        if value > MAX_COST_INPUTS[name]:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be at most {MAX_COST_INPUTS[name]:,}")
+
+    def build():
+        prices = data_handler.get_price_arrays()
+        monthly = monthly_costs(prices, users, storage, features)[:, 0]
+        return {
+            "users": users,
+            "storage": storage,
+            "features": features,
+            "annual_discount": ANNUAL_DISCOUNT,
+            "platforms": [
+                {"platform": name, "monthly_cost": _clean(cost), "annual_cost": _clean(cost * 12)}
+                for name, cost in zip(prices.names, monthly.tolist())
+            ],
+        }
+
+    return get_catalog().version, build
+
+
+# (path pattern, handler); captured groups are passed to the handler URL-decoded
+ROUTES = [
+    (re.compile(r"^/api/platforms/?$"), list_platforms),
+    (re.compile(r"^/api/platforms/([^/]+)/reviews/?$"), platform_reviews),
+    (re.compile(r"^/api/platforms/([^/]+)/?$"), platform_detail),
+    (re.compile(r"^/api/features/?$"), list_features),
+    (re.compile(r"^/api/features/platforms/?$"), platforms_with_features),
+    (re.compile(r"^/api/costs/?$"), costs),
+]
+
+
+class ResponseCache:
+    """Bounded LRU of encoded JSON bodies keyed by ETag"""
+
+    def __init__(self, max_entries=RESPONSE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, etag, build):
+        """Return (body, gzipped body or None) for etag, building on a miss"""
+        with self._lock:
+            entry = self._entries.get(etag)
+            if entry is not None:
+                self._entries.move_to_end(etag)
+                return entry
+        body = json.dumps(build(), default=_json_default, separators=(",", ":"), allow_nan=False).encode("utf-8")
+        entry = (body, gzip.compress(body, 6) if len(body) >= GZIP_MIN_BYTES else None)
+        with self._lock:
+            self._entries[etag] = entry
+            self._entries.move_to_end(etag)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+
+response_cache = ResponseCache()
+
+
+def make_etag(version, url):
+    """Strong ETag for one URL at one data version"""
+    digest = hashlib.sha1(f"{version}|{url}".encode("utf-8")).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match, etag):
+    """True when an If-None-Match header covers etag (weak comparison, ignoring our -gzip suffix)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.replace("-gzip\"", "\"") == etag:
+            return True
+    return False
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = "LCNCComparatorAPI/1.0"
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def _respond(self, send_body):
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        try:
+            for pattern, handler in ROUTES:
+                match = pattern.match(url.path)
+                if match:
+                    version, build = handler(params, *(unquote(group) for group in match.groups()))
+                    break
+            else:
+                raise ApiError(HTTPStatus.NOT_FOUND, f"No route for {url.path}")
+
+            etag = make_etag(version, self.path)
+            if etag_matches(self.headers.get("If-None-Match"), etag):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self._send_cache_headers(etag)
+                self.end_headers()
+                return
+
+            body, gzipped = response_cache.get_or_build(etag, build)
+            use_gzip = gzipped is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "application/json")
+            if use_gzip:
+                body = gzipped
+                # The compressed representation gets its own ETag, as it is a different byte stream
+                etag = etag[:-1] + '-gzip"'
+                self.send_header("Content-Encoding", "gzip")
+            self._send_cache_headers(etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if send_body:
+                self.wfile.write(body)
+        except ApiError as e:
+            self._send_error_json(e.status, str(e), send_body)
+        except Exception as e:
+            logger.exception(f"Error serving {self.path}: {str(e)}")
+            self._send_error_json(HTTPStatus.INTERNAL_SERVER_ERROR, "Internal server error", send_body)
+
+    def _send_cache_headers(self, etag):
+        self.send_header("ETag", etag)
+        # Clients may keep responses but must revalidate; a matching ETag costs one version check
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+
+    def _send_error_json(self, status, message, send_body):
+        body = json.dumps({"error": message}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.info(f"{self.address_string()} {format % args}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the platform catalog as a read-only JSON API")
+    parser.add_argument("--host", default=os.getenv("API_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("API_PORT", "8000")))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    server = ThreadingHTTPServer((args.host, args.port), ApiHandler)
+    logger.info(f"Serving API on http://{args.host}:{args.port}/api/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+"""Synthetic-scale benchmarks for the data and rendering hot paths.
+
+Generates a synthetic catalog (and optionally reviews) in the database named by
+--database-url, replacing any tables already there unless --reuse is given,
+times the hot paths and writes the results as JSON:
+
+    python -m benchmarks.run --platforms 10000 --reviews 1000000 --output bench.json
+    python -m benchmarks.run --platforms 10000 --reuse --baseline bench.json
+
+With --baseline the run is compared against a stored result file and exits
+with status 1 if any benchmark's median is slower than --threshold allows.
+"""
+import argparse
+import json
+import os
+import platform as host_platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+DEFAULT_DATABASE_URL = f"sqlite:///{os.path.join(tempfile.gettempdir(), 'lcnc_bench.db')}"
+
+
+def synthetic_platforms(count, vocabulary_size, features_per_platform, seed):
+    """Generate platform seed records with features drawn from a fixed vocabulary"""
+    from utils.operating_systems import OPERATING_SYSTEMS
+
+    rng = random.Random(seed)
+    vocabulary = [f"Feature {i}" for i in range(vocabulary_size)]
+    per_platform = min(features_per_platform, vocabulary_size)
+    for i in range(count):
+        low = rng.choice([0, 5, 10, 25, 50, 100])
+        yield {
+            "name": f"Platform {i:06d}",
+            "operating_system": ", ".join(rng.sample(OPERATING_SYSTEMS, rng.randint(1, 3))),
+            "speed_score": rng.randint(50, 99),
+            "accuracy_score": rng.randint(50, 99),
+            "maintenance_score": rng.randint(50, 99),
+            "price_range": (
+                f"${low}-{low * 10 + 50}/user/mo" if rng.random() < 0.3
+                else ("Free" if low == 0 else f"${low}") + f"-{low * 20 + 100}/mo"
+            ),
+            "features": rng.sample(vocabulary, per_platform),
+        }
+
+
+def generate(args):
+    """Recreate the schema and load the synthetic catalog and reviews"""
+    from sqlalchemy import func
+    from utils.database import Base, SessionLocal, Platform, get_engine, add_reviews
+    from utils.migrations import run_migrations
+    from utils.seed import upsert_platforms
+
+    # Start from empty tables so every run measures exactly the requested sizes
+    Base.metadata.drop_all(bind=get_engine())
+    Base.metadata.create_all(bind=get_engine())
+    run_migrations()
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        upsert_platforms(db, synthetic_platforms(
+            args.platforms, args.feature_vocabulary, args.features_per_platform, args.seed
+        ))
+        db.commit()
+        print(f"Loaded {args.platforms:,} platforms in {time.perf_counter() - started:.1f}s")
+
+        platform_ids = [platform_id for (platform_id,) in db.query(Platform.id)]
+        # Concentrate a share of reviews on one platform so deep pagination has something to walk
+        hot_platform = db.query(func.min(Platform.id)).scalar()
+        rng = random.Random(args.seed)
+        now = datetime.utcnow()
+        started = time.perf_counter()
+        written = 0
+        while written < args.reviews:
+            size = min(args.review_batch_size, args.reviews - written)
+            add_reviews(db, [
+                {
+                    "platform_id": hot_platform if rng.random() < 0.1 else rng.choice(platform_ids),
+                    "user_name": f"user{written + i}",
+                    "rating": float(rng.randint(1, 5)),
+                    "comment": "Synthetic review for benchmarking offline mobile workflows",
+                    "created_at": now - timedelta(seconds=rng.randint(0, 60 * 86400)),
+                }
+                for i in range(size)
+            ])
+            db.commit()
+            written += size
+        if args.reviews:
+            print(f"Loaded {args.reviews:,} reviews in {time.perf_counter() - started:.1f}s")
+    finally:
+        db.close()
+
+
+def measure(fn, repeat, setup=None):
+    """Run fn `repeat` times (after optional per-run setup) and return timing stats in ms"""
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "repeat": repeat,
+    }
+
+
+def benchmarks(repeat):
+    """Time the data and rendering hot paths against the loaded database"""
+    import numpy as np
+    from utils import data_handler, visualizations
+    from utils.catalog import get_catalog, reload_catalog
+    from utils.figure_cache import figure_cache
+    from utils.cost_engine import monthly_costs, scenario_grid
+    from utils.search import search_platforms, search_reviews
+
+    results = {}
+
+    def run(name, fn, setup=None):
+        results[name] = measure(fn, repeat, setup)
+        print(f"{name:<40} {results[name]['median_ms']:>12.3f} ms")
+
+    run("get_platform_data.cold", data_handler.get_platform_data, setup=reload_catalog)
+    run("get_platform_data.warm", data_handler.get_platform_data)
+
+    df = data_handler.get_platform_data()
+    run("filter_by_os.any", lambda: data_handler.filter_by_os(df, ["Windows", "Linux"]))
+    run("filter_by_os.all", lambda: data_handler.filter_by_os(df, ["Windows", "Linux"], "all"))
+
+    def fresh_snapshot():
+        reload_catalog()
+        get_catalog()
+
+    run("feature_matrix.build", data_handler.get_feature_matrix, setup=fresh_snapshot)
+    matrix = data_handler.get_feature_matrix()
+    query = matrix.features[:2]
+    run("feature_matrix.has_all", lambda: matrix.has_all(query))
+    run("feature_matrix.has_any", lambda: matrix.has_any(query))
+    run("get_feature_comparison", data_handler.get_feature_comparison)
+    run("get_platforms_with_features.sql", lambda: data_handler.get_platforms_with_features(query))
+
+    # Figure benchmarks clear the shared figure cache first so they keep timing construction
+    run("create_review_heatmap.all", lambda: visualizations.create_review_heatmap(), setup=figure_cache.clear)
+    first_platform = df['Platform'].iloc[0]
+    run("create_review_heatmap.one", lambda: visualizations.create_review_heatmap(first_platform), setup=figure_cache.clear)
+
+    run("similar_platforms.cold", lambda: data_handler.get_similar_platforms(first_platform, 10), setup=fresh_snapshot)
+    run("similar_platforms.warm", lambda: data_handler.get_similar_platforms(first_platform, 10))
+
+    weights = {"speed": 3, "accuracy": 2, "maintenance": 1, "price": 2, "rating": 1}
+    # A fresh speed weight per run keeps the per-weight result cache from answering
+    run("ranking.top_10", lambda: data_handler.get_top_ranked(dict(weights, speed=time.perf_counter()), 10))
+
+    run("get_reviews_page.first", lambda: data_handler.get_reviews_page(first_platform, 20))
+    _, cursor = data_handler.get_reviews_page(first_platform, 1000)
+    if cursor is not None:
+        run("get_reviews_page.deep", lambda: data_handler.get_reviews_page(first_platform, 20, before=cursor))
+
+    run("search.platforms", lambda: search_platforms("feature 1", 1, 20))
+    run("search.reviews", lambda: search_reviews("offline mobile", 1, 20))
+
+    prices = data_handler.get_price_arrays()
+    run("cost_engine.single", lambda: monthly_costs(prices, 5, 10, 2))
+    grid = scenario_grid(np.arange(1, 11), np.arange(10, 110, 10), np.arange(10))
+    run("cost_engine.grid_1000", lambda: monthly_costs(prices, *grid))
+
+    metrics = data_handler.get_performance_metrics(first_platform)
+    run("figure.radar", lambda: visualizations.create_radar_chart(metrics, first_platform), setup=figure_cache.clear)
+    run("figure.bar", lambda: visualizations.create_comparison_bar_chart(df, "Speed"), setup=figure_cache.clear)
+    run("figure.scatter", lambda: visualizations.create_scatter_plot(df), setup=figure_cache.clear)
+    # Building the figure in setup makes every timed run a cache hit
+    run("figure.radar.cached", lambda: visualizations.create_radar_chart(metrics, first_platform),
+        setup=lambda: visualizations.create_radar_chart(metrics, first_platform))
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print median deltas against a baseline and return the names that regressed"""
+    regressions = []
+    print(f"\n{'benchmark':<40} {'baseline':>12} {'current':>12} {'delta':>8}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<40} {'-':>12} {current['median_ms']:>12.3f} {'new':>8}")
+            continue
+        delta = (current['median_ms'] - previous['median_ms']) / previous['median_ms'] if previous['median_ms'] else 0.0
+        flag = " REGRESSION" if delta > threshold else ""
+        print(f"{name:<40} {previous['median_ms']:>12.3f} {current['median_ms']:>12.3f} {delta:>+8.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark data and rendering hot paths on a synthetic catalog")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL", DEFAULT_DATABASE_URL))
+    parser.add_argument("--platforms", type=int, default=100, help="Synthetic platforms (e.g. 100, 10000, 100000)")
+    parser.add_argument("--feature-vocabulary", type=int, default=200, help="Distinct feature names")
+    parser.add_argument("--features-per-platform", type=int, default=5)
+    parser.add_argument("--reviews", type=int, default=10000, help="Synthetic reviews (up to 10M)")
+    parser.add_argument("--review-batch-size", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark")
+    parser.add_argument("--reuse", action="store_true", help="Skip data generation and benchmark the existing database")
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--baseline", help="Compare against a previous results JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed median slowdown before failing (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    # utils.database reads DATABASE_URL at import time, so set it before importing anything from utils
+    os.environ["DATABASE_URL"] = args.database_url
+    if not args.reuse:
+        generate(args)
+
+    results = benchmarks(args.repeat)
+    report = {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(),
+            "database": args.database_url.split("://")[0],
+            "platforms": args.platforms,
+            "feature_vocabulary": args.feature_vocabulary,
+            "features_per_platform": args.features_per_platform,
+            "reviews": args.reviews,
+            "python": sys.version.split()[0],
+            "machine": host_platform.platform(),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,61 @@
 import streamlit as st
 import pandas as pd
+from utils.catalog import INTERNAL_COLUMNS, get_catalog, get_ratings
+from utils.data_handler import get_feature_matrix, with_ratings
+from utils.exports import iter_frame_chunks
+from utils.figure_cache import frame_fingerprint
+from components.export_controls import render_export
 
-def render_comparison_matrix(df):
-    """Render the comparison matrix component"""
+# Rows per page offered for the comparison matrix
+PAGE_SIZES = [25, 50, 100, 250]
+
+def _sort_key(column):
+    """Categorical catalog columns sort by category order, so order their categories alphabetically first"""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.reorder_categories(sorted(column.cat.categories))
+    return column
+
+def _page_slice(df, sort_column, descending, page, page_size):
+    """Sort server-side and return only the requested page"""
+    if sort_column is not None:
+        df = df.sort_values(sort_column, ascending=not descending, kind='stable', key=_sort_key)
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
+
+def render_comparison_matrix(df, filters=None):
+    """Render the comparison matrix component, one sorted page at a time
+
+    filters describes how df was selected from the catalog (e.g. the OS filter) and keys
+    the shared export; without it the export is keyed by a fingerprint of the rows.
+    """
     st.subheader("Platform Comparison Matrix")
 
     if df.empty:
         st.error("No platform data available. Please check the database connection.")
         return
 
-    # Format numeric columns to show as percentages
+    # Internal filter columns are neither shown nor exported; ratings come from the platforms' running aggregates
+    df = with_ratings(df.drop(columns=INTERNAL_COLUMNS, errors='ignore'))
     numeric_cols = [col for col in df.columns if col.endswith('_Score')]
-    df_display = df.copy()
-    for col in numeric_cols:
-        df_display[col] = df_display[col].apply(lambda x: f"{x:.1f}%")
+
+    # Sorting and paging controls; only the visible page is sent to the browser
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    with col1:
+        sort_column = st.selectbox(
+            "Sort by",
+            [None] + list(df.columns),
+            format_func=lambda col: "Catalog order" if col is None else col.replace('_', ' '),
+            key="matrix_sort_column"
+        )
+    with col2:
+        descending = st.toggle("Descending", value=True, key="matrix_sort_desc")
+    with col3:
+        page_size = st.selectbox("Rows per page", PAGE_SIZES, key="matrix_page_size")
+    page_count = max(1, -(-len(df) // page_size))
+    with col4:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, key="matrix_page")
+
+    df_display = _page_slice(df, sort_column, descending, min(page, page_count), page_size)
 
     # Configure column widths with improved visibility
     column_config = {
@@ -32,44 +74,57 @@ def render_comparison_matrix(df):
         'Features': st.column_config.TextColumn(
             width='large',
             help="Available features"
+        ),
+        'Rating': st.column_config.NumberColumn(
+            width='small',
+            format="%.2f ⭐",
+            help="Average review rating (1-5), smoothed towards the neutral rating for platforms with few reviews"
+        ),
+        'Review_Count': st.column_config.NumberColumn(
+            "Reviews",
+            width='small',
+            help="Number of user reviews"
         )
     }
 
-    # Add score columns to configuration
+    # Scores stay numeric; the column config formats them as percentages
     for col in numeric_cols:
-        column_config[col] = st.column_config.TextColumn(
+        column_config[col] = st.column_config.NumberColumn(
             width='small',
+            format="%.1f%%",
             help=f"{col.replace('_Score', '')} performance score"
         )
 
     # Display total number of platforms
-    st.caption(f"Total Platforms: {len(df_display)}")
+    st.caption(f"Total Platforms: {len(df)} · Page {min(page, page_count)} of {page_count}")
 
-    # Display the dataframe with improved formatting and increased height
+    # Height fits the page (35px per row plus header) instead of a fixed tall frame
     st.dataframe(
         df_display,
-        height=1200,  # Further increased height
+        height=min(35 * (len(df_display) + 1) + 3, 1200),
         use_container_width=True,
         hide_index=True,
         column_config=column_config
     )
 
-    # Add download button
-    csv = df.to_csv(index=False)
-    st.download_button(
-        label="Download Comparison Data",
-        data=csv,
-        file_name="platform_comparison.csv",
-        mime="text/csv"
+    # Exports are built on request and shared until the catalog, ratings or filters change;
+    # the ratings version is the (catalog, reviews) pair
+    rows_key = filters if filters is not None else frame_fingerprint(df, ['Platform'])
+    render_export(
+        "Comparison Data",
+        "platform_comparison",
+        (get_ratings().version, rows_key),
+        lambda fmt: iter_frame_chunks(df.set_index('Platform')),
+        key="comparison_export"
     )
 
 def render_feature_checklist(feature_matrix):
     """Render the feature comparison checklist"""
     st.subheader("Feature Comparison")
 
-    # Configure column widths for feature matrix
+    # Render booleans as checkboxes; the matrix itself stays boolean
     feature_column_config = {
-        col: st.column_config.TextColumn(width='small')
+        col: st.column_config.CheckboxColumn(width='small', disabled=True)
         for col in feature_matrix.columns
     }
 
@@ -83,12 +138,17 @@ def render_feature_checklist(feature_matrix):
         column_config=feature_column_config
     )
 
-    # Add feature matrix download button
-    csv = feature_matrix.to_csv()
-    st.download_button(
-        label="Download Feature Matrix",
-        data=csv,
-        file_name="feature_matrix.csv",
-        mime="text/csv",
-        key="feature_matrix_download"
-    )
\ No newline at end of file
+    # The export unpacks the bit-packed matrix a chunk of platforms at a time
+    render_export(
+        "Feature Matrix",
+        "feature_matrix",
+        get_catalog().version,
+        _feature_matrix_frames,
+        key="feature_matrix_export"
+    )
+
+def _feature_matrix_frames(fmt):
+    """Chunks of the full feature matrix; CSV keeps the check marks, binary formats stay boolean"""
+    for frame in get_feature_matrix().iter_frames():
+        frame.index.name = 'Platform'
+        yield frame.replace({True: '✓', False: '✗'}) if fmt == 'csv' else frame
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
-from utils.data_handler import get_platform_data, get_performance_metrics
+from utils.data_handler import get_platform_data, get_performance_metrics_many, get_platform_ratings, get_similar_platforms
+from utils.features import split_features
 from utils.visualizations import create_radar_chart
 
 def render_comparison_slider():
@@ -22,11 +23,29 @@ def render_comparison_slider():
             key="platform_a"
         )
 
-        # Get and display metrics for platform A
-        metrics_a = get_performance_metrics(platform_a)
+    with col2:
+        st.markdown("### Platform B")
+        platform_b = st.selectbox(
+            "Select second platform",
+            [p for p in platforms if p != platform_a],
+            key="platform_b"
+        )
+
+    # Fetch both platforms' metrics with one index lookup; ratings come from the platforms' running aggregates
+    metrics = get_performance_metrics_many([platform_a, platform_b])
+    ratings = get_platform_ratings([platform_a, platform_b])
+
+    with col1:
+        # Display metrics for platform A
+        metrics_a = metrics[platform_a]
         st.metric("Speed Score", f"{metrics_a['speed']}%")
         st.metric("Accuracy Score", f"{metrics_a['accuracy']}%")
         st.metric("Maintenance Score", f"{metrics_a['maintenance']}%")
+        st.metric(
+            "User Rating",
+            f"{ratings.at[platform_a, 'Rating']:.2f} / 5",
+            help=f"{ratings.at[platform_a, 'Review_Count']} reviews; smoothed for platforms with few reviews"
+        )
 
         # Display radar chart for platform A
         radar_a = create_radar_chart(metrics_a, platform_a)
@@ -35,22 +54,20 @@ def render_comparison_slider():
         # Display features for platform A
         features_a = df[df['Platform'] == platform_a]['Features'].iloc[0]
         st.markdown("#### Features")
-        for feature in features_a.split(','):
-            st.markdown(f"- {feature.strip()}")
+        for feature in split_features(features_a):
+            st.markdown(f"- {feature}")
 
     with col2:
-        st.markdown("### Platform B")
-        platform_b = st.selectbox(
-            "Select second platform",
-            [p for p in platforms if p != platform_a],
-            key="platform_b"
-        )
-
-        # Get and display metrics for platform B
-        metrics_b = get_performance_metrics(platform_b)
+        # Display metrics for platform B
+        metrics_b = metrics[platform_b]
         st.metric("Speed Score", f"{metrics_b['speed']}%")
         st.metric("Accuracy Score", f"{metrics_b['accuracy']}%")
         st.metric("Maintenance Score", f"{metrics_b['maintenance']}%")
+        st.metric(
+            "User Rating",
+            f"{ratings.at[platform_b, 'Rating']:.2f} / 5",
+            help=f"{ratings.at[platform_b, 'Review_Count']} reviews; smoothed for platforms with few reviews"
+        )
 
         # Display radar chart for platform B
         radar_b = create_radar_chart(metrics_b, platform_b)
@@ -59,8 +76,8 @@ def render_comparison_slider():
         # Display features for platform B
         features_b = df[df['Platform'] == platform_b]['Features'].iloc[0]
         st.markdown("#### Features")
-        for feature in features_b.split(','):
-            st.markdown(f"- {feature.strip()}")
+        for feature in split_features(features_b):
+            st.markdown(f"- {feature}")
 
     # Display price comparison
     st.markdown("### Price Comparison")
@@ -68,4 +85,38 @@ def render_comparison_slider():
         'Platform': [platform_a, platform_b],
         'Price Range': df[df['Platform'].isin([platform_a, platform_b])]['Price_Range'].tolist()
     })
-    st.dataframe(price_comparison, use_container_width=True)
\ No newline at end of file
+    st.dataframe(price_comparison, use_container_width=True)
+
+    render_similar_platforms(platform_a)
+
+def render_similar_platforms(platform_name):
+    """Render the platforms most similar to the given one"""
+    st.markdown(f"### Platforms Similar to {platform_name}")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        count = st.slider("Number of similar platforms", min_value=1, max_value=20, value=5, key="similar_count")
+    with col2:
+        feature_weight = st.slider(
+            "Weight of feature overlap vs. scores and price",
+            min_value=0.0, max_value=1.0, value=0.5, step=0.1,
+            key="similar_feature_weight"
+        )
+
+    similar = get_similar_platforms(platform_name, count, feature_weight)
+    if similar.empty:
+        st.info("No other platforms to compare against.")
+        return
+
+    st.dataframe(
+        similar,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Similarity': st.column_config.ProgressColumn(min_value=0.0, max_value=1.0, format="%.2f"),
+            'Feature_Overlap': st.column_config.NumberColumn("Feature Overlap", format="%.2f",
+                                                             help="Jaccard similarity of the feature sets"),
+            'Score_Similarity': st.column_config.NumberColumn("Score Similarity", format="%.2f",
+                                                              help="Closeness of speed, accuracy, maintenance and price"),
+        }
+    )
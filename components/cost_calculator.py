@@ -1,37 +1,54 @@
 import streamlit as st
 import pandas as pd
-from utils.database import SessionLocal, Platform
+import numpy as np
+import plotly.graph_objects as go
+from utils.data_handler import get_price_arrays
+from utils.cost_engine import (
+    USER_RATE, STORAGE_RATE, FEATURE_RATE, ANNUAL_DISCOUNT, monthly_costs, break_even
+)
 
-def calculate_monthly_cost(base_price, users, storage_gb, features_count):
-    """Calculate monthly cost based on parameters"""
-    # Basic calculation formula
-    user_cost = users * 10  # $10 per user
-    storage_cost = storage_gb * 0.5  # $0.5 per GB
-    feature_cost = features_count * 5  # $5 per additional feature
-    
-    return base_price + user_cost + storage_cost + feature_cost
+def render_cost_curves(prices, storage, features):
+    """Render cost-vs-users curves for two platforms and where they break even"""
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        platform_a = st.selectbox("Platform A", prices.names, key="cost_curve_a")
+    with col2:
+        platform_b = st.selectbox(
+            "Platform B",
+            [p for p in prices.names if p != platform_a],
+            key="cost_curve_b"
+        )
+    with col3:
+        max_users = st.number_input("Up to Users", min_value=2, value=200, key="cost_curve_users")
 
-def get_platform_base_prices():
-    """Get base prices for all platforms"""
-    db = SessionLocal()
-    try:
-        platforms = db.query(Platform).all()
-        prices = {}
-        for platform in platforms:
-            # Extract numeric value from price range (e.g., "$25-299/mo" -> 25)
-            base_price = int(platform.price_range.split('-')[0].replace('$', ''))
-            prices[platform.name] = base_price
-        return prices
-    finally:
-        db.close()
+    users = np.arange(1, max_users + 1)
+    costs = monthly_costs(prices, users, storage, features)
+    cost_a = costs[prices.index[platform_a]]
+    cost_b = costs[prices.index[platform_b]]
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=users, y=cost_a, mode='lines', name=platform_a))
+    fig.add_trace(go.Scatter(x=users, y=cost_b, mode='lines', name=platform_b))
+    fig.update_layout(
+        title='Monthly Cost by Number of Users',
+        xaxis_title='Users',
+        yaxis_title='Monthly Cost ($)',
+        height=400
+    )
+    st.plotly_chart(fig, use_container_width=True, key="cost_curves_chart")
+
+    points = break_even(users, cost_a, cost_b)
+    if not points:
+        cheaper = platform_a if cost_a[0] <= cost_b[0] else platform_b
+        st.caption(f"{cheaper} is the cheaper option across the whole range.")
+    for at, direction in points:
+        cheaper = platform_a if direction == "a_cheaper" else platform_b
+        st.caption(f"{cheaper} becomes the cheaper option above ~{at:,.1f} users.")
 
 def render_cost_calculator():
     """Render the cost analysis calculator"""
     st.header("Cost Analysis Calculator")
     
-    # Get base prices for all platforms
-    platform_prices = get_platform_base_prices()
-    
     # User inputs
     col1, col2 = st.columns(2)
     
@@ -43,49 +60,44 @@ def render_cost_calculator():
         features = st.number_input("Additional Features Needed", min_value=0, value=2)
         timeframe = st.selectbox("Billing Period", ["Monthly", "Annually"])
     
-    # Calculate costs for each platform
-    costs = {}
-    for platform, base_price in platform_prices.items():
-        monthly_cost = calculate_monthly_cost(base_price, users, storage, features)
-        annual_cost = monthly_cost * 12
-        costs[platform] = {
-            "Monthly": monthly_cost,
-            "Annually": annual_cost,
-            "Annual Savings": monthly_cost * 12 * 0.1  # 10% discount for annual billing
-        }
+    # Calculate costs for every priced platform in one vectorized pass
+    prices = get_price_arrays()
+    monthly = monthly_costs(prices, users, storage, features)[:, 0]
+    annual = monthly * 12
     
     # Display results
     st.subheader("Cost Comparison")
     
     # Create comparison table
-    comparison_data = []
-    for platform, cost_data in costs.items():
-        comparison_data.append({
-            "Platform": platform,
-            f"Cost ({timeframe})": cost_data[timeframe],
-            "Monthly Cost": cost_data["Monthly"],
-            "Annual Cost": cost_data["Annually"],
-            "Potential Annual Savings": cost_data["Annual Savings"]
-        })
+    df = pd.DataFrame({
+        "Platform": prices.names,
+        f"Cost ({timeframe})": monthly if timeframe == "Monthly" else annual,
+        "Monthly Cost": monthly,
+        "Annual Cost": annual,
+        "Potential Annual Savings": annual * ANNUAL_DISCOUNT
+    })
     
-    df = pd.DataFrame(comparison_data)
+    # Format currency columns at render time; the values stay numeric
+    currency_config = {
+        col: st.column_config.NumberColumn(format="$%.2f")
+        for col in df.columns if "Cost" in col or "Savings" in col
+    }
     
-    # Format currency columns
-    currency_cols = [col for col in df.columns if "Cost" in col or "Savings" in col]
-    for col in currency_cols:
-        df[col] = df[col].apply(lambda x: f"${x:,.2f}")
+    st.dataframe(df, use_container_width=True, column_config=currency_config)
     
-    st.dataframe(df, use_container_width=True)
+    if len(prices.names) >= 2:
+        with st.expander("Cost Curves & Break-even"):
+            render_cost_curves(prices, storage, features)
     
     # Add cost breakdown explanation
     with st.expander("See Cost Breakdown"):
-        st.markdown("""
+        st.markdown(f"""
         ### Cost Components
-        - **Base Price**: Platform's starting price
-        - **User Cost**: $10 per user per month
-        - **Storage Cost**: $0.5 per GB per month
-        - **Feature Cost**: $5 per additional feature per month
+        - **Base Price**: Platform's starting price (per user for per-user plans, annual plans spread monthly)
+        - **User Cost**: ${USER_RATE} per user per month
+        - **Storage Cost**: ${STORAGE_RATE} per GB per month
+        - **Feature Cost**: ${FEATURE_RATE} per additional feature per month
         
         ### Annual Discount
-        - 10% discount applied for annual billing
+        - {ANNUAL_DISCOUNT:.0%} discount applied for annual billing
         """)
@@ -0,0 +1,30 @@
+import streamlit as st
+from utils.exports import EXPORT_FORMATS, available_formats, export_cache
+
+def render_export(label, name, version, frames_for, key):
+    """Render a format picker and build the export only when the user asks for it
+
+    frames_for(fmt) must return an iterable of DataFrames; it is called only on a
+    cache miss, and the prepared file is shared until `version` changes.
+    """
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        fmt = st.selectbox("Format", available_formats(), format_func=str.upper, key=f"{key}_format")
+
+    cache_key = (name, fmt, version)
+    prepared = export_cache.get(cache_key)
+    with col2:
+        if prepared is None and st.button(f"Prepare {label}", key=f"{key}_prepare"):
+            with st.spinner(f"Preparing {label.lower()}..."):
+                prepared = export_cache.build(cache_key, frames_for(fmt), fmt)
+        if prepared is not None:
+            extension, mime = EXPORT_FORMATS[fmt]
+            # The prepared file stays on disk; the button reads it from the open handle
+            with prepared:
+                st.download_button(
+                    label=f"Download {label}",
+                    data=prepared,
+                    file_name=f"{name}.{extension}",
+                    mime=mime,
+                    key=f"{key}_download"
+                )
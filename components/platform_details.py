@@ -1,6 +1,6 @@
 import streamlit as st
 from utils.visualizations import create_radar_chart, create_review_heatmap
-from utils.data_handler import get_performance_metrics
+from utils.data_handler import get_performance_metrics, get_platform_ratings
 from components.reviews import render_review_form, display_reviews
 
 def render_platform_details(platform_name):
@@ -10,13 +10,16 @@ def render_platform_details(platform_name):
     metrics = get_performance_metrics(platform_name)
 
     # Display metrics in columns
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Speed Score", f"{metrics['speed']}%")
     with col2:
         st.metric("Accuracy Score", f"{metrics['accuracy']}%")
     with col3:
         st.metric("Maintenance Score", f"{metrics['maintenance']}%")
+    with col4:
+        rating = get_platform_ratings([platform_name]).loc[platform_name]
+        st.metric("User Rating", f"{rating['Rating']:.2f} / 5", help=f"{int(rating['Review_Count'])} reviews")
 
     # Display radar chart
     radar_chart = create_radar_chart(metrics, platform_name)
@@ -0,0 +1,44 @@
+import streamlit as st
+from utils.data_handler import get_top_ranked
+from utils.ranking import RANKING_CRITERIA
+
+CRITERION_LABELS = {
+    'speed': "Speed",
+    'accuracy': "Accuracy",
+    'maintenance': "Maintenance",
+    'price': "Low Price",
+    'rating': "Review Rating",
+}
+
+def render_ranking():
+    """Render the weighted platform ranking"""
+    st.subheader("Platform Ranking")
+    st.caption("Weight what matters to you; platforms are ranked by the weighted average of the normalized criteria.")
+
+    # Weight sliders side by side
+    weights = {}
+    for column, criterion in zip(st.columns(len(RANKING_CRITERIA)), RANKING_CRITERIA):
+        with column:
+            weights[criterion] = st.slider(
+                CRITERION_LABELS[criterion], min_value=0, max_value=10, value=5, key=f"rank_weight_{criterion}"
+            )
+    top_k = st.slider("Platforms to show", min_value=5, max_value=100, value=10, step=5, key="rank_top_k")
+
+    if not any(weights.values()):
+        st.info("Give at least one criterion a weight above zero.")
+        return
+
+    ranking = get_top_ranked(weights, top_k)
+    if ranking.empty:
+        st.error("No platform data available. Please check the database connection.")
+        return
+
+    column_config = {
+        'Rank': st.column_config.NumberColumn(width='small'),
+        'Score': st.column_config.ProgressColumn(min_value=0.0, max_value=1.0, format="%.3f"),
+    }
+    for criterion in RANKING_CRITERIA:
+        column_config[criterion.title()] = st.column_config.NumberColumn(
+            CRITERION_LABELS[criterion], format="%.2f", help="Normalized to 0-1, higher is better"
+        )
+    st.dataframe(ranking, use_container_width=True, hide_index=True, column_config=column_config)
@@ -1,7 +1,15 @@
 import streamlit as st
-from utils.database import SessionLocal, Review, Platform
+from utils.database import SessionLocal, Platform, add_review
+from utils.data_handler import get_reviews_page
+from utils.review_queue import WRITE_BEHIND_ENABLED, get_review_queue
+from utils.catalog import get_ratings, invalidate_catalog
+from utils.exports import iter_review_frames
+from components.export_controls import render_export
 from datetime import datetime
 
+# Reviews fetched per "Load more" click
+REVIEW_PAGE_SIZE = 20
+
 def render_review_form(platform_name):
     """Render the review submission form"""
     st.subheader("Submit a Review")
@@ -13,45 +21,95 @@ def render_review_form(platform_name):
         comment = st.text_area("Your Review")
         submit_button = st.form_submit_button("Submit Review")
         
-        if submit_button and user_name and comment:
+        if submit_button and user_name and comment and WRITE_BEHIND_ENABLED:
+            # Hand the review to the background writer instead of waiting on a commit
+            created_at = datetime.utcnow()
+            get_review_queue().submit(platform_name, user_name, rating, comment, created_at)
+            # Show it at the top of this session's pages until the flush moves the reviews version and they reload
+            _reviews_state(platform_name)["reviews"].insert(0, {
+                "id": None,
+                "user_name": user_name,
+                "rating": rating,
+                "comment": comment,
+                "created_at": created_at,
+            })
+            st.success("Thank you for your review! It will appear shortly.")
+        elif submit_button and user_name and comment:
             db = SessionLocal()
             try:
                 # Get platform
                 platform = db.query(Platform).filter(Platform.name == platform_name).first()
                 if platform:
-                    # Create new review
-                    new_review = Review(
+                    # Create new review and update the daily rollup in the same transaction
+                    add_review(
+                        db,
                         platform_id=platform.id,
                         user_name=user_name,
                         rating=rating,
                         comment=comment,
                         created_at=datetime.utcnow()
                     )
-                    db.add(new_review)
                     db.commit()
+                    # Re-check versions on the next read so the new rating shows without waiting out the check interval
+                    invalidate_catalog()
+                    # Drop cached pages so the new review shows up first
+                    st.session_state.pop(_reviews_state_key(platform_name), None)
                     st.success("Thank you for your review!")
             finally:
                 db.close()
 
+def _reviews_state_key(platform_name):
+    """Session-state key holding the review pages already loaded for a platform"""
+    return f"reviews_{platform_name}"
+
+def _reviews_state(platform_name):
+    """Loaded review pages for a platform, restarted from the first page when the reviews data version changes"""
+    # The shared ratings snapshot follows the reviews version, so this costs no query between version checks
+    version = get_ratings().version
+    state_key = _reviews_state_key(platform_name)
+    state = st.session_state.get(state_key)
+    if state is None or state["version"] != version:
+        reviews, cursor = get_reviews_page(platform_name, REVIEW_PAGE_SIZE)
+        state = {"version": version, "reviews": reviews, "cursor": cursor}
+        st.session_state[state_key] = state
+    return state
+
 def display_reviews(platform_name):
-    """Display all reviews for a platform"""
+    """Display a platform's reviews newest first, one page at a time"""
     st.subheader("User Reviews")
-    
-    db = SessionLocal()
-    try:
-        platform = db.query(Platform).filter(Platform.name == platform_name).first()
-        if platform and platform.reviews:
-            for review in platform.reviews:
-                with st.container():
-                    col1, col2 = st.columns([1, 4])
-                    with col1:
-                        st.write(f"⭐ {review.rating}/5")
-                    with col2:
-                        st.write(f"**{review.user_name}**")
-                    st.write(review.comment)
-                    st.write(f"Posted on: {review.created_at.strftime('%Y-%m-%d %H:%M')}")
-                    st.divider()
-        else:
-            st.info("No reviews yet. Be the first to review!")
-    finally:
-        db.close()
+
+    # Keep loaded pages across reruns so "Load more" only fetches the next page;
+    # reviews written elsewhere reset them once the data version moves
+    state = _reviews_state(platform_name)
+
+    if not state["reviews"]:
+        st.info("No reviews yet. Be the first to review!")
+        return
+
+    for review in state["reviews"]:
+        with st.container():
+            col1, col2 = st.columns([1, 4])
+            with col1:
+                st.write(f"⭐ {review['rating']}/5")
+            with col2:
+                st.write(f"**{review['user_name']}**")
+            st.write(review['comment'])
+            st.write(f"Posted on: {review['created_at'].strftime('%Y-%m-%d %H:%M')}")
+            st.divider()
+
+    if state["cursor"] is not None:
+        if st.button("Load more reviews", key=f"load_more_reviews_{platform_name}"):
+            reviews, cursor = get_reviews_page(platform_name, REVIEW_PAGE_SIZE, before=state["cursor"])
+            state["reviews"].extend(reviews)
+            state["cursor"] = cursor
+            st.rerun()
+
+    # Streams every review for the platform in keyset chunks rather than the loaded pages;
+    # the shared ratings snapshot's (catalog, reviews) version keys it without another query
+    render_export(
+        "Reviews",
+        f"reviews_{platform_name}",
+        get_ratings().version,
+        lambda fmt: iter_review_frames(platform_name),
+        key=f"reviews_export_{platform_name}"
+    )
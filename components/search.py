@@ -0,0 +1,66 @@
+import streamlit as st
+from utils.search import search_platforms, search_reviews
+
+# Results shown per page in each search tab
+SEARCH_PAGE_SIZE = 20
+
+def _current_page(kind, query):
+    """Current 1-based page of one result list"""
+    state_key = f"search_page_{kind}"
+    # A new query starts again from the first page
+    if st.session_state.get(f"{state_key}_query") != query:
+        st.session_state[state_key] = 1
+        st.session_state[f"{state_key}_query"] = query
+    return st.session_state[state_key]
+
+def _render_pager(kind, page, has_more):
+    """Previous/next buttons for one result list"""
+    state_key = f"search_page_{kind}"
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        if page > 1 and st.button("Previous", key=f"{state_key}_previous"):
+            st.session_state[state_key] = page - 1
+            st.rerun()
+    with col2:
+        st.caption(f"Page {page}")
+    with col3:
+        if has_more and st.button("Next", key=f"{state_key}_next"):
+            st.session_state[state_key] = page + 1
+            st.rerun()
+
+def render_search():
+    """Render full-text search over platforms and review comments"""
+    st.subheader("Search")
+    query = st.text_input(
+        "Search platforms and reviews",
+        placeholder='e.g. offline mobile',
+        key="search_query"
+    ).strip()
+    if not query:
+        st.info("Enter words to search platform names, features and review comments.")
+        return
+
+    platforms_tab, reviews_tab = st.tabs(["Platforms", "Reviews"])
+
+    with platforms_tab:
+        page = _current_page("platforms", query)
+        results, has_more = search_platforms(query, page, SEARCH_PAGE_SIZE)
+        if not results:
+            st.info("No matching platforms.")
+        for result in results:
+            st.markdown(f"**{result['name']}**")
+            st.caption(result['features'] or "")
+        _render_pager("platforms", page, has_more)
+
+    with reviews_tab:
+        page = _current_page("reviews", query)
+        results, has_more = search_reviews(query, page, SEARCH_PAGE_SIZE)
+        if not results:
+            st.info("No matching reviews.")
+        for result in results:
+            with st.container():
+                st.write(f"**{result['platform']}** · ⭐ {result['rating']}/5 · {result['user_name']}")
+                st.write(result['comment'])
+                st.caption(f"Posted on: {result['created_at'].strftime('%Y-%m-%d %H:%M')}")
+                st.divider()
+        _render_pager("reviews", page, has_more)
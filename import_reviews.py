@@ -0,0 +1,148 @@
+from utils.database import SessionLocal, Platform, Review, add_reviews, fold_reviews_into_rollup
+from datetime import datetime, timezone
+import argparse
+import csv
+import io
+import json
+import math
+import os
+import sys
+import time
+
+# Columns written per review, in COPY order
+REVIEW_COLUMNS = ["platform_id", "user_name", "rating", "comment", "created_at"]
+
+def read_records(path, file_format):
+    """Stream review records from a JSONL or CSV file; a line that is not valid JSON yields None"""
+    with open(path, newline="", encoding="utf-8") as f:
+        if file_format == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        yield None
+
+def to_row(record, platform_ids):
+    """Convert one input record to a reviews row, or None if it cannot be imported"""
+    if not isinstance(record, dict):
+        return None
+    try:
+        platform_id = platform_ids.get((record.get("platform") or record.get("platform_name") or "").strip())
+        if platform_id is None:
+            return None
+        rating = float(record["rating"])
+        created_at = record.get("created_at")
+        created_at = datetime.fromisoformat(created_at) if created_at else datetime.utcnow()
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+    # created_at is stored as naive UTC; offset-aware inputs are converted rather than taken as wall time
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    # "nan"/"inf" parse as floats but would poison the rollup sums
+    if not (math.isfinite(rating) and 1 <= rating <= 5):
+        return None
+    return {
+        "platform_id": platform_id,
+        "user_name": record.get("user_name"),
+        "rating": rating,
+        "comment": record.get("comment"),
+        "created_at": created_at,
+    }
+
+def csv_field(value):
+    """One COPY CSV field: NULL as an unquoted empty field, anything else quoted so "" stays an empty string"""
+    if value is None:
+        return ""
+    return '"' + str(value).replace('"', '""') + '"'
+
+def copy_rows(db, rows):
+    """Insert rows with PostgreSQL COPY on the session's own connection and transaction"""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(",".join(csv_field(value) for value in (
+            row["platform_id"], row["user_name"], row["rating"], row["comment"],
+            row["created_at"].isoformat(sep=" ")
+        )) + "\n")
+    buffer.seek(0)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {Review.__tablename__} ({', '.join(REVIEW_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+    finally:
+        cursor.close()
+
+def insert_batch(db, rows, use_copy):
+    """Insert one batch of reviews plus its rollup increments, then commit"""
+    if use_copy:
+        copy_rows(db, rows)
+        fold_reviews_into_rollup(db, rows)
+    else:
+        add_reviews(db, rows)
+    db.commit()
+
+def import_reviews(path, file_format=None, batch_size=10000, use_copy=None):
+    """Stream reviews from a file into the database in large batches"""
+    file_format = file_format or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    db = SessionLocal()
+    try:
+        if use_copy is None:
+            use_copy = db.get_bind().dialect.name == "postgresql"
+        # One query resolves every platform name for the whole import
+        platform_ids = dict(db.query(Platform.name, Platform.id).all())
+
+        imported = skipped = 0
+        started = time.perf_counter()
+        batch = []
+        for record in read_records(path, file_format):
+            row = to_row(record, platform_ids)
+            if row is None:
+                skipped += 1
+                continue
+            batch.append(row)
+            if len(batch) >= batch_size:
+                insert_batch(db, batch, use_copy)
+                imported += len(batch)
+                batch = []
+                elapsed = time.perf_counter() - started
+                print(f"Imported {imported:,} rows ({imported / elapsed:,.0f} rows/s)")
+        if batch:
+            insert_batch(db, batch, use_copy)
+            imported += len(batch)
+
+        elapsed = time.perf_counter() - started
+        rate = imported / elapsed if elapsed else 0
+        print(f"Done: {imported:,} rows imported, {skipped:,} skipped in {elapsed:.1f}s ({rate:,.0f} rows/s)")
+        return imported, skipped
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import reviews from a JSONL or CSV export")
+    parser.add_argument("path", help="File with one review per line/row: platform, user_name, rating, comment, created_at")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="Input format (default: from file extension)")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Rows inserted per transaction")
+    parser.add_argument("--no-copy", action="store_true", help="Use executemany even on PostgreSQL")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        print(f"File not found: {args.path}", file=sys.stderr)
+        return 1
+    try:
+        print(f"Importing reviews from {args.path}...")
+        import_reviews(args.path, args.format, args.batch_size, False if args.no_copy else None)
+        return 0
+    except Exception as e:
+        print(f"Error importing reviews: {str(e)}", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
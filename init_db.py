@@ -1,10 +1,17 @@
 from utils.database import init_db
+import argparse
 import sys
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Create/migrate the schema and upsert the platform catalog")
+    parser.add_argument(
+        "--seed",
+        help="Platform seed file (.json, .jsonl, .csv or .parquet); defaults to data/platforms.json"
+    )
+    args = parser.parse_args(argv)
     try:
         print("Initializing database...")
-        init_db()
+        init_db(args.seed)
         print("Database initialization completed successfully!")
         print("All platforms have been loaded into the database.")
         return 0
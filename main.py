@@ -1,11 +1,12 @@
+from utils.startup import timed_import, mark, startup_report
+import os
+import json
 import streamlit as st
-import pandas as pd
-from utils.data_handler import get_platform_data, filter_by_os, get_feature_comparison
-from utils.visualizations import create_comparison_bar_chart, create_scatter_plot
-from components.comparison_matrix import render_comparison_matrix, render_feature_checklist
-from components.platform_details import render_platform_details
-from components.cost_calculator import render_cost_calculator
-from components.comparison_slider import render_comparison_slider
+from utils.operating_systems import OPERATING_SYSTEMS
+from utils.instrumentation import start_rerun, finish_rerun, track
+
+# Plotting and component modules are imported by the view that needs them, not up front
+data_handler = timed_import("utils.data_handler")
 
 # Page configuration
 st.set_page_config(
@@ -20,6 +21,12 @@ st.set_page_config(
     }  # Hide menu items to maximize space
 )
 
+# Per-rerun SQL/timing instrumentation; the debug panel shows raw SQL and profiles, so only the
+# deployment can turn it on (DEBUG_PANEL=1), never a URL parameter
+debug_panel = os.getenv('DEBUG_PANEL', '').lower() in ('1', 'true', 'yes')
+log_rerun_stats = os.getenv('QUERY_STATS_LOG', '').lower() in ('1', 'true', 'yes')
+start_rerun(profile=st.session_state.pop('profile_rerun', False))
+
 # Remove padding
 st.markdown("""
     <style>
@@ -39,44 +46,65 @@ st.markdown("""
 st.markdown("<h1 style='margin-bottom:0.5rem'>Low-Code/No-Code Platform Comparison Tool</h1>", unsafe_allow_html=True)
 
 # Get data
-df = get_platform_data()
+with track("get_platform_data"):
+    df = data_handler.get_platform_data()
 
 # Sidebar filters
 with st.sidebar:
     st.header("Filters")
-    os_filter = st.selectbox(
+    os_filter = st.multiselect(
         "Operating System",
-        ["All", "Windows", "Linux", "Web-based", "Mobile"]
+        OPERATING_SYSTEMS,
+        help="Leave empty to show all platforms"
+    )
+    os_match = st.radio(
+        "Match",
+        ["any", "all"],
+        horizontal=True,
+        format_func=lambda m: "Any selected" if m == "any" else "All selected"
     )
 
 # Filter data
-filtered_df = filter_by_os(df, os_filter)
-
-# Main content
-tab1, tab2, tab3, tab4 = st.tabs([
-    "Comparison Matrix",
-    "Performance Analysis",
-    "Feature Comparison",
-    "Cost Calculator"
-])
+filtered_df = data_handler.filter_by_os(df, os_filter, os_match)
+
+# Main content; only the selected view runs, so unused views cost nothing per rerun
+view = st.radio(
+    "View",
+    [
+        "Comparison Matrix",
+        "Performance Analysis",
+        "Feature Comparison",
+        "Cost Calculator",
+        "Ranking",
+        "Search"
+    ],
+    horizontal=True,
+    label_visibility="collapsed"
+)
 
-with tab1:
+if view == "Comparison Matrix":
+    comparison_slider = timed_import("components.comparison_slider")
+    comparison_matrix = timed_import("components.comparison_matrix")
     # Add the comparison slider at the top
-    render_comparison_slider()
+    with track("render_comparison_slider"):
+        comparison_slider.render_comparison_slider()
     st.markdown("---")
     # Original comparison matrix below with full width
-    render_comparison_matrix(filtered_df)
+    with track("render_comparison_matrix"):
+        comparison_matrix.render_comparison_matrix(filtered_df, (tuple(os_filter), os_match))
 
-with tab2:
+elif view == "Performance Analysis":
+    visualizations = timed_import("utils.visualizations")
+    platform_details = timed_import("components.platform_details")
     # Performance metrics visualization
     col1, col2 = st.columns(2)
 
-    with col1:
-        speed_chart = create_comparison_bar_chart(filtered_df, "Speed")
+    with col1, track("create_comparison_bar_chart"):
+        speed_chart = visualizations.create_comparison_bar_chart(filtered_df, "Speed")
         st.plotly_chart(speed_chart, use_container_width=True, key="speed_comparison_chart")
 
-    with col2:
-        scatter_plot = create_scatter_plot(filtered_df)
+    with col2, track("create_scatter_plot"):
+        scatter_plot = visualizations.create_scatter_plot(filtered_df)
         st.plotly_chart(scatter_plot, use_container_width=True, key="speed_accuracy_scatter")
 
     # Platform details
@@ -84,14 +112,31 @@ with tab2:
         "Select Platform for Detailed Analysis",
         filtered_df['Platform'].tolist()
     )
-    render_platform_details(selected_platform)
+    with track("render_platform_details"):
+        platform_details.render_platform_details(selected_platform)
 
-with tab3:
-    feature_matrix = get_feature_comparison()
-    render_feature_checklist(feature_matrix)
+elif view == "Feature Comparison":
+    comparison_matrix = timed_import("components.comparison_matrix")
+    with track("render_feature_checklist"):
+        feature_matrix = data_handler.get_feature_comparison()
+        comparison_matrix.render_feature_checklist(feature_matrix)
 
-with tab4:
-    render_cost_calculator()
+elif view == "Cost Calculator":
+    cost_calculator = timed_import("components.cost_calculator")
+    with track("render_cost_calculator"):
+        cost_calculator.render_cost_calculator()
+
+elif view == "Ranking":
+    ranking = timed_import("components.ranking")
+    with track("render_ranking"):
+        ranking.render_ranking()
+
+elif view == "Search":
+    search = timed_import("components.search")
+    with track("render_search"):
+        search.render_search()
+
+mark("first_paint")
 
 # Methodology explanation in expandable section to save space
 with st.expander("Methodology"):
@@ -108,6 +153,58 @@ with st.expander("Methodology"):
     4. Community feedback
     """)
 
+# Startup timing report, opt-in for profiling cold starts
+if os.getenv('SHOW_STARTUP_REPORT', '').lower() in ('1', 'true', 'yes'):
+    with st.expander("Startup Timing"):
+        report = startup_report()
+        st.json(report['milestones'])
+        st.dataframe(report['imports'], use_container_width=True, hide_index=True)
+
+# Rerun instrumentation results
+rerun_stats = finish_rerun(log=log_rerun_stats)
+if debug_panel and rerun_stats is not None:
+    with st.expander("Debug: Queries & Timing"):
+        total = rerun_stats.total
+        col1, col2, col3, col4, col5 = st.columns(5)
+        col1.metric("SQL Statements", total.statements)
+        col2.metric("Rows Read", total.rows_read, help="Rows returned to ORM session queries")
+        col3.metric("Rows Written", total.rows_written)
+        col4.metric("SQL Time", f"{total.sql_seconds * 1000:.1f} ms")
+        col5.metric("Rerun Time", f"{total.wall_seconds * 1000:.1f} ms")
+
+        stats = rerun_stats.as_dict()
+        st.markdown("**Per component**")
+        st.dataframe(
+            [{'component': name, **values} for name, values in stats['components'].items()],
+            use_container_width=True,
+            hide_index=True
+        )
+        st.markdown("**Most repeated statements**")
+        st.dataframe(stats['top_statements'], use_container_width=True, hide_index=True)
+        st.download_button(
+            "Download Rerun Stats (JSON)",
+            data=json.dumps(stats, indent=2),
+            file_name="rerun_stats.json",
+            mime="application/json",
+            key="download_rerun_stats"
+        )
+
+        st.markdown("**Figure cache**")
+        st.json(timed_import("utils.figure_cache").figure_cache.stats())
+
+        review_queue = timed_import("utils.review_queue")
+        if review_queue.WRITE_BEHIND_ENABLED:
+            st.markdown("**Review write-behind queue**")
+            st.json(review_queue.get_review_queue().stats())
+
+        st.button(
+            "Profile Next Rerun",
+            on_click=lambda: st.session_state.update(profile_rerun=True),
+            help="Runs the next interaction under cProfile"
+        )
+        if rerun_stats.profile_text:
+            st.code(rerun_stats.profile_text)
+
 # Footer with minimal space
 st.markdown("---")
 st.markdown(
@@ -0,0 +1,63 @@
+from utils.database import SessionLocal, rebuild_review_rollup, rebuild_platform_ratings
+from utils.search import rebuild_search_indexes
+import argparse
+import sys
+
+def rebuild_rollups():
+    """Recompute review_daily_rollup from the reviews table"""
+    db = SessionLocal()
+    try:
+        rebuild_review_rollup(db)
+        db.commit()
+        print("Review daily rollup rebuilt successfully!")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+def rebuild_ratings():
+    """Recompute every platform's review count, rating sum and smoothed rating"""
+    db = SessionLocal()
+    try:
+        rebuild_platform_ratings(db)
+        db.commit()
+        print("Platform ratings rebuilt successfully!")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+def rebuild_search():
+    """Re-index platforms and reviews for full-text search"""
+    db = SessionLocal()
+    try:
+        rebuild_search_indexes(db)
+        db.commit()
+        print("Search indexes rebuilt successfully!")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+COMMANDS = {
+    "rebuild-ratings": rebuild_ratings,
+    "rebuild-rollups": rebuild_rollups,
+    "rebuild-search": rebuild_search,
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Database maintenance commands")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args(argv)
+    try:
+        COMMANDS[args.command]()
+        return 0
+    except Exception as e:
+        print(f"Error running {args.command}: {str(e)}", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
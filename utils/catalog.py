@@ -0,0 +1,195 @@
+import logging
+import os
+import threading
+import time
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+from sqlalchemy import select
+
+from .database import ReadSessionLocal, Platform, CATALOG_SCOPE, REVIEWS_SCOPE, get_data_version
+
+logger = logging.getLogger(__name__)
+
+# Columns the catalog carries for filtering but which are not meant for display or export
+INTERNAL_COLUMNS = [
+    'OS_Mask', 'Price_Min', 'Price_Max', 'Price_Per_User', 'Price_Unit', 'Price_Open_Ended'
+]
+
+# Catalog DataFrame column -> platforms column, in display order
+CATALOG_COLUMNS = {
+    'Platform': Platform.name,
+    'Operating_System': Platform.operating_system,
+    'Speed_Score': Platform.speed_score,
+    'Accuracy_Score': Platform.accuracy_score,
+    'Maintenance_Score': Platform.maintenance_score,
+    'Price_Range': Platform.price_range,
+    'Features': Platform.features,
+    'OS_Mask': Platform.os_mask,
+    'Price_Min': Platform.price_min,
+    'Price_Max': Platform.price_max,
+    'Price_Per_User': Platform.price_per_user,
+    'Price_Unit': Platform.price_unit,
+    'Price_Open_Ended': Platform.price_open_ended,
+}
+
+CATEGORY_COLUMNS = ['Operating_System', 'Price_Range', 'Price_Unit']
+
+# "numpy_nullable" or "pyarrow" for Arrow-backed catalog columns; unset keeps plain NumPy dtypes
+CATALOG_DTYPE_BACKEND = os.getenv('CATALOG_DTYPE_BACKEND')
+
+# Platforms fetched per chunk while loading the catalog
+LOAD_CHUNK_ROWS = 20000
+
+# Seconds between data-version checks; reads inside this window never touch the database
+VERSION_CHECK_INTERVAL = float(os.getenv('CATALOG_VERSION_CHECK_INTERVAL', '5'))
+
+
+class CatalogSnapshot:
+    """Immutable view of the platform catalog at one data version, shared by all sessions"""
+
+    def __init__(self, version, df):
+        self.version = version
+        self.df = df
+        self._derived = {}
+        # Re-entrant so a builder can depend on another derived structure
+        self._derived_lock = threading.RLock()
+
+    def derived(self, key, builder):
+        """Return a structure derived from this snapshot, building it at most once"""
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+        with self._derived_lock:
+            if key not in self._derived:
+                self._derived[key] = builder(self)
+            return self._derived[key]
+
+
+class _ScopeCache:
+    """Process-wide snapshot of data scopes, re-checked at most every VERSION_CHECK_INTERVAL seconds
+
+    The snapshot's version is the scope's counter, or a tuple of counters when it follows several scopes.
+    """
+
+    def __init__(self, scopes, load):
+        self.scopes = scopes
+        self.load = load
+        self.snapshot = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+    def get(self):
+        """Return the shared snapshot, reloading only when a data version has changed"""
+        snapshot = self.snapshot
+        if snapshot is not None and time.monotonic() - self.checked_at < VERSION_CHECK_INTERVAL:
+            return snapshot
+
+        with self.lock:
+            # Another thread may have refreshed while we waited for the lock
+            snapshot = self.snapshot
+            if snapshot is not None and time.monotonic() - self.checked_at < VERSION_CHECK_INTERVAL:
+                return snapshot
+
+            db = ReadSessionLocal()
+            try:
+                # Read the version before the rows so a concurrent write can only make us reload twice
+                versions = tuple(get_data_version(db, scope) for scope in self.scopes)
+                version = versions[0] if len(versions) == 1 else versions
+                if snapshot is None or snapshot.version != version:
+                    snapshot = self.load(db, version)
+                    self.snapshot = snapshot
+                self.checked_at = time.monotonic()
+                return snapshot
+            except Exception as e:
+                logger.error(f"Error loading {'/'.join(self.scopes)} snapshot: {str(e)}")
+                raise
+            finally:
+                db.close()
+
+    def invalidate(self):
+        self.checked_at = 0.0
+
+    def reset(self):
+        with self.lock:
+            self.snapshot = None
+            self.checked_at = 0.0
+
+
+def _load_snapshot(db, version):
+    """Build a catalog snapshot from the platforms table
+
+    Selects only the catalog columns with SQLAlchemy Core and reads them straight
+    into typed DataFrame columns, without materializing ORM objects.
+    """
+    logger.info(f"Loading platform catalog at data version {version}")
+    query = select(*(column.label(name) for name, column in CATALOG_COLUMNS.items())).order_by(Platform.id)
+    options = {'dtype_backend': CATALOG_DTYPE_BACKEND} if CATALOG_DTYPE_BACKEND else {}
+    # Rows arrive as Python tuples, so read in chunks and keep only the typed columns of each
+    chunks = [
+        chunk.astype({name: 'category' for name in CATEGORY_COLUMNS})
+        for chunk in pd.read_sql(query, db.connection(), chunksize=LOAD_CHUNK_ROWS, **options)
+    ]
+    count = sum(len(chunk) for chunk in chunks)
+    logger.info(f"Found {count} platforms")
+
+    if not count:
+        logger.warning("No platforms found in database")
+        return CatalogSnapshot(version, pd.DataFrame())
+
+    # A column that is all NULL within one chunk is read with a placeholder dtype; give it
+    # the column's real dtype so concat does not have to exclude it when picking dtypes
+    for name in chunks[0].columns:
+        typed = [chunk[name].dtype for chunk in chunks if chunk[name].notna().any()]
+        if typed:
+            for chunk in chunks:
+                if chunk[name].dtype != typed[0] and chunk[name].isna().all():
+                    chunk[name] = chunk[name].astype(typed[0])
+
+    # Few distinct values repeated across the catalog; categories store each once
+    df = pd.concat(chunks, ignore_index=True)
+    for name in CATEGORY_COLUMNS:
+        df[name] = union_categoricals([chunk[name] for chunk in chunks])
+    logger.info(f"Created DataFrame with {len(df)} rows and {len(df.columns)} columns")
+    return CatalogSnapshot(version, df)
+
+
+def _load_ratings(db, version):
+    """Build a ratings snapshot from the denormalized review aggregates on the platforms table"""
+    rows = db.execute(
+        select(Platform.name, Platform.review_count, Platform.rating_sum, Platform.bayesian_rating)
+    ).all()
+    df = pd.DataFrame(rows, columns=['Platform', 'Review_Count', 'Rating_Sum', 'Rating']).set_index('Platform')
+    return CatalogSnapshot(version, df)
+
+
+_catalog = _ScopeCache((CATALOG_SCOPE,), _load_snapshot)
+# Follows the catalog too, so newly added platforms get a ratings row
+_ratings = _ScopeCache((CATALOG_SCOPE, REVIEWS_SCOPE), _load_ratings)
+
+
+def get_catalog():
+    """Return the shared catalog snapshot, reloading only when the data version has changed"""
+    return _catalog.get()
+
+
+def get_ratings():
+    """Return the shared ratings snapshot: review count, rating sum and smoothed rating indexed by platform name
+
+    It follows the reviews data version, so new reviews do not force a full catalog reload.
+    Its version is the (catalog, reviews) version pair.
+    """
+    return _ratings.get()
+
+
+def invalidate_catalog():
+    """Make the next get_catalog() / get_ratings() call re-check the data version immediately; in-process writers call it after committing"""
+    _catalog.invalidate()
+    _ratings.invalidate()
+
+
+def reload_catalog():
+    """Drop the cached snapshots so the next calls rebuild them from the database"""
+    _catalog.reset()
+    _ratings.reset()
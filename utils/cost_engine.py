@@ -0,0 +1,98 @@
+import numpy as np
+
+# Add-on rates applied on top of a platform's base price, per month
+USER_RATE = 10  # $ per user
+STORAGE_RATE = 0.5  # $ per GB
+FEATURE_RATE = 5  # $ per additional feature
+
+ANNUAL_DISCOUNT = 0.1
+
+
+def _billed_yearly(df):
+    """Boolean array marking annual list prices; works for NumPy, nullable and Arrow-backed columns"""
+    return df['Price_Unit'].eq('year').fillna(False).to_numpy(dtype=bool)
+
+
+class PriceArrays:
+    """Column arrays of the priced platforms, aligned by position"""
+
+    def __init__(self, names, base, per_user):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.base = base  # monthly entry price, per user where per_user is set
+        self.per_user = per_user
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build from a catalog frame, skipping platforms without a parsed minimum price"""
+        if df.empty:
+            return cls([], np.zeros(0), np.zeros(0, dtype=bool))
+        priced = df[df['Price_Min'].notna()]
+        base = priced['Price_Min'].to_numpy(dtype=float)
+        # Annual list prices are spread over twelve months
+        base = np.where(_billed_yearly(priced), base / 12, base)
+        return cls(priced['Platform'].tolist(), base, priced['Price_Per_User'].to_numpy(dtype=bool))
+
+
+def normalized_monthly_price(df):
+    """Monthly entry price per platform scaled to [0, 1] on a log scale; NaN where unpriced"""
+    price = df['Price_Min'].to_numpy(dtype=float)
+    # Annual list prices are spread over twelve months
+    price = np.log1p(np.where(_billed_yearly(df), price / 12, price))
+    top = np.nanmax(price) if (~np.isnan(price)).any() else 0.0
+    return price / top if top > 0 else np.where(np.isnan(price), np.nan, 0.0)
+
+
+def scenario_grid(users, storage, features):
+    """Expand value ranges into flat scenario arrays covering every users x storage x features combination"""
+    u, s, f = np.meshgrid(
+        np.asarray(users, dtype=float),
+        np.asarray(storage, dtype=float),
+        np.asarray(features, dtype=float),
+        indexing='ij'
+    )
+    return u.ravel(), s.ravel(), f.ravel()
+
+
+def monthly_costs(prices, users, storage, features):
+    """Monthly cost of every platform in every scenario as a (platforms, scenarios) array
+
+    users/storage/features are scalars or equal-length arrays, one entry per scenario.
+    """
+    users, storage, features = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(users, dtype=float)),
+        np.atleast_1d(np.asarray(storage, dtype=float)),
+        np.atleast_1d(np.asarray(features, dtype=float))
+    )
+    add_ons = users * USER_RATE + storage * STORAGE_RATE + features * FEATURE_RATE
+    per_user_base = np.where(prices.per_user, prices.base, 0.0)
+    flat_base = prices.base - per_user_base
+    # One (platforms, scenarios) allocation; the rest is added in place
+    costs = np.multiply.outer(per_user_base, users)
+    costs += flat_base[:, None]
+    costs += add_ons
+    return costs
+
+
+def break_even(x, cost_a, cost_b):
+    """Points along x where cost_a and cost_b cross, linearly interpolated
+
+    Returns a list of (x, direction) with direction "a_cheaper" when a becomes
+    the cheaper option past that point and "b_cheaper" otherwise.
+    """
+    x = np.asarray(x, dtype=float)
+    diff = np.asarray(cost_a, dtype=float) - np.asarray(cost_b, dtype=float)
+    sign = np.sign(diff)
+    # Carry the last non-zero sign across exact ties so a touch is not reported twice
+    nonzero = np.flatnonzero(sign)
+    if len(nonzero) < 2:
+        return []
+    crossings = nonzero[1:][sign[nonzero[1:]] != sign[nonzero[:-1]]]
+    previous = nonzero[np.searchsorted(nonzero, crossings) - 1]
+
+    points = []
+    for lo, hi in zip(previous, crossings):
+        d_lo, d_hi = diff[lo], diff[hi]
+        at = x[lo] + (x[hi] - x[lo]) * d_lo / (d_lo - d_hi)
+        points.append((float(at), "a_cheaper" if d_hi < 0 else "b_cheaper"))
+    return points
@@ -1,5 +1,13 @@
+import threading
 import pandas as pd
-from .database import SessionLocal, Platform
+from sqlalchemy import func, select, tuple_
+from .database import ReadSessionLocal, Platform, Feature, Review, platform_features, RATING_PRIOR_MEAN
+from .catalog import get_catalog, get_ratings
+from .features import FeatureMatrix, split_features
+from .operating_systems import os_mask_for
+from .cost_engine import PriceArrays
+from .similarity import FEATURE_WEIGHT, SimilarityIndex
+from .ranking import RankingIndex
 import logging
 
 # Set up logging
@@ -7,68 +15,185 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def get_platform_data():
-    """Returns platform data as a pandas DataFrame"""
-    db = SessionLocal()
-    try:
-        logger.info("Fetching platform data from database")
-        platforms = db.query(Platform).all()
-        logger.info(f"Found {len(platforms)} platforms")
-
-        if not platforms:
-            logger.warning("No platforms found in database")
-            return pd.DataFrame()
-
-        data = {
-            'Platform': [p.name for p in platforms],
-            'Operating_System': [p.operating_system for p in platforms],
-            'Speed_Score': [p.speed_score for p in platforms],
-            'Accuracy_Score': [p.accuracy_score for p in platforms],
-            'Maintenance_Score': [p.maintenance_score for p in platforms],
-            'Price_Range': [p.price_range for p in platforms],
-            'Features': [p.features for p in platforms]
-        }
-
-        df = pd.DataFrame(data)
-        logger.info(f"Created DataFrame with {len(df)} rows and {len(df.columns)} columns")
-        return df
-    except Exception as e:
-        logger.error(f"Error fetching platform data: {str(e)}")
-        raise
-    finally:
-        db.close()
+    """Returns platform data as a pandas DataFrame
+
+    The frame comes from the process-wide catalog snapshot and must be treated as read-only.
+    """
+    return get_catalog().df
 
-def filter_by_os(df, os_filter):
-    """Filter platforms by operating system"""
-    if os_filter == "All":
+def filter_by_os(df, os_filter, match="any"):
+    """Filter platforms by operating system
+
+    os_filter is "All", one canonical OS name or a list of them; match="any" keeps
+    platforms supporting at least one, match="all" those supporting every one.
+    """
+    if isinstance(os_filter, str):
+        os_filter = [] if os_filter == "All" else [os_filter]
+    if not os_filter or df.empty:
         return df
-    return df[df['Operating_System'].str.contains(os_filter)]
+    if match not in ("all", "any"):
+        raise ValueError(f"match must be 'all' or 'any', got {match!r}")
+
+    query = os_mask_for(os_filter)
+    masks = df['OS_Mask'].to_numpy()
+    if match == "all":
+        return df[(masks & query) == query]
+    return df[(masks & query) != 0]
+
+def _build_metrics_index(snapshot):
+    """Map platform name to its metrics dict for one catalog snapshot"""
+    df = snapshot.df
+    if df.empty:
+        return {}
+    return {
+        name: {'speed': speed, 'accuracy': accuracy, 'maintenance': maintenance}
+        for name, speed, accuracy, maintenance in zip(
+            df['Platform'], df['Speed_Score'], df['Accuracy_Score'], df['Maintenance_Score']
+        )
+    }
+
+def get_performance_metrics_many(platform_names):
+    """Get performance metrics for several platforms from the in-memory catalog index
+
+    Returns a dict keyed by platform name; unknown names are left out.
+    """
+    index = get_catalog().derived('metrics_index', _build_metrics_index)
+    return {name: index[name] for name in platform_names if name in index}
 
 def get_performance_metrics(platform_name):
     """Get detailed performance metrics for a specific platform"""
-    db = SessionLocal()
+    return get_performance_metrics_many([platform_name]).get(platform_name)
+
+def _build_feature_matrix(snapshot):
+    """Tokenize every platform's features once per catalog snapshot"""
+    df = snapshot.df
+    if df.empty:
+        return FeatureMatrix.from_feature_lists([], [])
+    return FeatureMatrix.from_feature_lists(
+        df['Platform'].tolist(),
+        [split_features(features) for features in df['Features']]
+    )
+
+def get_feature_matrix():
+    """Get the bit-packed platform x feature matrix for the current catalog"""
+    return get_catalog().derived('feature_matrix', _build_feature_matrix)
+
+def _build_similarity_index(snapshot):
+    """Score vectors and feature rows for similarity queries over one catalog snapshot"""
+    return SimilarityIndex.from_frame(snapshot.df, snapshot.derived('feature_matrix', _build_feature_matrix))
+
+def get_similar_platforms(platform_name, k=5, feature_weight=FEATURE_WEIGHT):
+    """Get the k platforms most similar to platform_name by features, scores and price
+
+    Neighbour lists are cached on the catalog snapshot, so they are recomputed only
+    after the catalog changes. Returns an empty frame for unknown platforms.
+    """
+    index = get_catalog().derived('similarity_index', _build_similarity_index)
+    if platform_name not in index.index:
+        return pd.DataFrame(columns=['Platform', 'Similarity', 'Feature_Overlap', 'Score_Similarity'])
+    return index.neighbours(platform_name, k, feature_weight)
+
+_ranking_index = None
+_ranking_lock = threading.Lock()
+
+def get_top_ranked(weights, k=10):
+    """Rank the catalog by a weighted composite of scores, price and smoothed review rating
+
+    weights maps each of speed/accuracy/maintenance/price/rating to a non-negative
+    weight. The criteria matrix is rebuilt only when the catalog or ratings change,
+    and results are cached per weight vector in between.
+    """
+    global _ranking_index
+    snapshot, ratings = get_catalog(), get_ratings()
+    version = (snapshot.version, ratings.version)
+    with _ranking_lock:
+        if _ranking_index is None or _ranking_index.version != version:
+            _ranking_index = RankingIndex.from_frame(version, snapshot.df, ratings.df['Rating'])
+        index = _ranking_index
+    return index.top(weights, k)
+
+def get_platform_ratings(platform_names):
+    """Smoothed rating and review count indexed by platform name
+
+    The ratings snapshot re-checks its version separately from the catalog, so a
+    just-added platform may be missing for a few seconds; it gets a new platform's
+    values (the prior mean and no reviews) until then.
+    """
+    ratings = get_ratings().df.reindex(platform_names)
+    ratings['Rating'] = ratings['Rating'].fillna(RATING_PRIOR_MEAN)
+    ratings['Review_Count'] = ratings['Review_Count'].fillna(0).astype(int)
+    return ratings[['Rating', 'Review_Count']]
+
+def with_ratings(df):
+    """Copy of a catalog frame with each platform's smoothed rating and review count appended"""
+    ratings = get_platform_ratings(df['Platform'])
+    df = df.copy()
+    df['Rating'] = ratings['Rating'].to_numpy()
+    df['Review_Count'] = ratings['Review_Count'].to_numpy()
+    return df
+
+def get_price_arrays():
+    """Get the priced platforms' cost-engine arrays for the current catalog"""
+    return get_catalog().derived('price_arrays', lambda snapshot: PriceArrays.from_frame(snapshot.df))
+
+def get_feature_comparison():
+    """Generate feature comparison matrix as a boolean platform x feature DataFrame"""
+    return get_feature_matrix().to_frame()
+
+def get_platforms_with_features(feature_names, match="all"):
+    """Return names of platforms having all (or any) of the given features, filtered in SQL
+
+    Uses the features/platform_features tables, so the database answers from its
+    indexes instead of the app scanning every platform's features string.
+    """
+    feature_names = sorted(set(feature_names))
+    if match not in ("all", "any"):
+        raise ValueError(f"match must be 'all' or 'any', got {match!r}")
+    if not feature_names:
+        return []
+
+    matching = (
+        select(platform_features.c.platform_id)
+        .join(Feature, Feature.id == platform_features.c.feature_id)
+        .where(Feature.name.in_(feature_names))
+        .group_by(platform_features.c.platform_id)
+    )
+    if match == "all":
+        matching = matching.having(func.count() == len(feature_names))
+
+    db = ReadSessionLocal()
     try:
-        platform = db.query(Platform).filter(Platform.name == platform_name).first()
-        return {
-            'speed': platform.speed_score,
-            'accuracy': platform.accuracy_score,
-            'maintenance': platform.maintenance_score
-        }
+        query = select(Platform.name).where(Platform.id.in_(matching)).order_by(Platform.name)
+        return db.execute(query).scalars().all()
     finally:
         db.close()
 
-def get_feature_comparison():
-    """Generate feature comparison matrix"""
-    df = get_platform_data()
-    features = set()
-    for feature_list in df['Features']:
-        features.update([f.strip() for f in feature_list.split(',')])
-
-    comparison_matrix = {}
-    for platform in df['Platform']:
-        platform_features = df[df['Platform'] == platform]['Features'].iloc[0]
-        comparison_matrix[platform] = {
-            feature: '✓' if feature in platform_features else '✗'
-            for feature in features
-        }
-
-    return pd.DataFrame(comparison_matrix).T
\ No newline at end of file
+def get_reviews_page(platform_name, page_size=20, before=None):
+    """Get one page of a platform's reviews, newest first, using keyset pagination
+
+    before is the cursor returned with the previous page (None for the first page).
+    Returns (reviews, next_cursor); next_cursor is None once there are no more reviews.
+    Each page is a single range scan of ix_reviews_platform_created.
+    """
+    query = (
+        select(Review.id, Review.user_name, Review.rating, Review.comment, Review.created_at)
+        .join(Platform, Platform.id == Review.platform_id)
+        .where(Platform.name == platform_name)
+        .order_by(Review.created_at.desc(), Review.id.desc())
+        .limit(page_size + 1)
+    )
+    if before is not None:
+        query = query.where(tuple_(Review.created_at, Review.id) < tuple_(*before))
+
+    db = ReadSessionLocal()
+    try:
+        rows = db.execute(query).all()
+    finally:
+        db.close()
+
+    reviews = [row._asdict() for row in rows[:page_size]]
+    next_cursor = None
+    if len(rows) > page_size:
+        last = reviews[-1]
+        next_cursor = (last['created_at'], last['id'])
+    return reviews, next_cursor
@@ -1,23 +1,107 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy import (
+    create_engine, Column, Integer, String, Float, Boolean, ForeignKey, Date, DateTime, Table, Index,
+    select, delete, insert, update, func, bindparam
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, relationship, validates
 import os
+import threading
 from datetime import datetime
+from .features import split_features
+from .operating_systems import parse_os_mask
+from .pricing import parse_price_range
 
-# Get database URL from environment variable
+# Get database URL from environment variable; engines are only created on first use
 DATABASE_URL = os.getenv('DATABASE_URL')
-if not DATABASE_URL:
-    raise ValueError("DATABASE_URL environment variable is not set")
 
-# Create SQLAlchemy engine
-engine = create_engine(DATABASE_URL)
+# Optional read-only replica for catalog, heatmap and review-listing reads
+DATABASE_REPLICA_URL = os.getenv('DATABASE_REPLICA_URL')
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _env_flag(name, default):
+    value = os.getenv(name)
+    return default if value is None else value.lower() in ('1', 'true', 'yes')
+
+def engine_options(url):
+    """Connection pool and statement cache settings for create_engine, from DB_* environment variables"""
+    options = {
+        'pool_pre_ping': _env_flag('DB_POOL_PRE_PING', True),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '1800')),
+        'query_cache_size': int(os.getenv('DB_QUERY_CACHE_SIZE', '500')),
+    }
+    url = make_url(url)
+    # In-memory SQLite uses a single-connection pool without size/overflow settings
+    if not (url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:')):
+        options['pool_size'] = int(os.getenv('DB_POOL_SIZE', '5'))
+        options['max_overflow'] = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+    return options
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+def get_engine():
+    """Return the primary engine, creating it on first use"""
+    if 'primary' not in _engines:
+        with _engines_lock:
+            if 'primary' not in _engines:
+                if not DATABASE_URL:
+                    raise ValueError("DATABASE_URL environment variable is not set")
+                _engines['primary'] = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+    return _engines['primary']
+
+def get_read_engine():
+    """Return the replica engine, or the primary one when no replica is configured"""
+    if not DATABASE_REPLICA_URL:
+        return get_engine()
+    if 'replica' not in _engines:
+        with _engines_lock:
+            if 'replica' not in _engines:
+                _engines['replica'] = create_engine(DATABASE_REPLICA_URL, **engine_options(DATABASE_REPLICA_URL))
+    return _engines['replica']
+
+def __getattr__(name):
+    """Keep `engine` / `read_engine` importable as module attributes without creating them at import time"""
+    if name == 'engine':
+        return get_engine()
+    if name == 'read_engine':
+        return get_read_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class _LazySessionFactory:
+    """sessionmaker stand-in that binds to its engine on the first session"""
+
+    def __init__(self, get_bind):
+        self._get_bind = get_bind
+        self._factory = None
+
+    def __call__(self, **kwargs):
+        if self._factory is None:
+            self._factory = sessionmaker(autocommit=False, autoflush=False, bind=self._get_bind())
+        return self._factory(**kwargs)
+
+# Create session factories: SessionLocal for writes, ReadSessionLocal for replica-safe reads
+SessionLocal = _LazySessionFactory(get_engine)
+ReadSessionLocal = _LazySessionFactory(get_read_engine)
 
 # Create declarative base
 Base = declarative_base()
 
+# Bayesian smoothing for platform ratings: every platform starts with RATING_PRIOR_WEIGHT
+# virtual reviews of RATING_PRIOR_MEAN stars, so a single 5-star review does not top the ranking
+RATING_PRIOR_MEAN = 3.0
+RATING_PRIOR_WEIGHT = 5
+
+# Association between platforms and their normalized features
+platform_features = Table(
+    "platform_features",
+    Base.metadata,
+    Column("platform_id", Integer, ForeignKey("platforms.id", ondelete="CASCADE"), primary_key=True),
+    Column("feature_id", Integer, ForeignKey("features.id", ondelete="CASCADE"), primary_key=True),
+    # The primary key serves platform -> features; this one serves feature -> platforms filters
+    Index("ix_platform_features_feature_platform", "feature_id", "platform_id"),
+)
+
 class Platform(Base):
     """Platform model for storing platform data"""
     __tablename__ = "platforms"
@@ -25,12 +109,54 @@ class Platform(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True)
     operating_system = Column(String)
+    os_mask = Column(Integer, nullable=False, default=0, server_default="0")  # Bitmask over OPERATING_SYSTEMS
     speed_score = Column(Float)
     accuracy_score = Column(Float)
     maintenance_score = Column(Float)
     price_range = Column(String)
+    # Structured form of price_range, filled by parse_price_range on write
+    price_min = Column(Float)
+    price_max = Column(Float)
+    price_per_user = Column(Boolean, nullable=False, default=False, server_default="0")
+    price_unit = Column(String)  # "month" / "year"
+    price_open_ended = Column(Boolean, nullable=False, default=False, server_default="0")
     features = Column(String)
-    reviews = relationship("Review", back_populates="platform", cascade="all, delete-orphan")
+    # Running review aggregates, updated in the same transaction as each review insert
+    review_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum = Column(Float, nullable=False, default=0, server_default="0")
+    bayesian_rating = Column(Float, nullable=False, default=RATING_PRIOR_MEAN, server_default=str(RATING_PRIOR_MEAN))
+    reviews = relationship(
+        "Review",
+        back_populates="platform",
+        cascade="all, delete-orphan",
+        order_by="desc(Review.created_at)"
+    )
+    feature_set = relationship("Feature", secondary=platform_features, back_populates="platforms")
+
+    @validates("operating_system")
+    def _parse_operating_system(self, key, value):
+        """Keep os_mask in step with the free-text operating_system column"""
+        self.os_mask = parse_os_mask(value)
+        return value
+
+    @validates("price_range")
+    def _parse_price_range(self, key, value):
+        """Keep the structured price columns in step with the free-text price_range column"""
+        price = parse_price_range(value)
+        self.price_min = price.min_price
+        self.price_max = price.max_price
+        self.price_per_user = price.per_user
+        self.price_unit = price.billing_unit
+        self.price_open_ended = price.open_ended
+        return value
+
+class Feature(Base):
+    """Feature model; one row per distinct feature name"""
+    __tablename__ = "features"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True, nullable=False)
+    platforms = relationship("Platform", secondary=platform_features, back_populates="feature_set")
 
 class Review(Base):
     """Review model for storing user reviews and ratings"""
@@ -44,304 +170,253 @@ class Review(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     platform = relationship("Platform", back_populates="reviews")
 
-def init_db():
-    """Initialize database with sample data"""
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+    __table_args__ = (
+        # Newest-first listing per platform; id breaks ties for keyset pagination
+        Index("ix_reviews_platform_created", "platform_id", created_at.desc(), id.desc()),
+    )
+
+class ReviewDailyRollup(Base):
+    """Per-platform, per-day review count and rating sum, maintained alongside review inserts"""
+    __tablename__ = "review_daily_rollup"
+
+    platform_id = Column(Integer, ForeignKey("platforms.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Float, nullable=False, default=0)
+
+    __table_args__ = (Index("ix_review_daily_rollup_day", "day"),)
+
+# Data-version scopes; readers cache per scope and reload when the counter moves
+CATALOG_SCOPE = "catalog"
+REVIEWS_SCOPE = "reviews"
+
+class DataVersion(Base):
+    """Monotonic change counter per data scope, bumped in the same transaction as the write"""
+    __tablename__ = "data_versions"
+
+    scope = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+class SchemaMigration(Base):
+    """Record of a data/schema migration that has been applied"""
+    __tablename__ = "schema_migrations"
+
+    id = Column(String, primary_key=True)
+    applied_at = Column(DateTime, default=datetime.utcnow)
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+_IN_CHUNK = 500
+
+def _feature_ids_by_name(db, names):
+    """Map existing feature names to their ids"""
+    ids = {}
+    for start in range(0, len(names), _IN_CHUNK):
+        chunk = names[start:start + _IN_CHUNK]
+        ids.update(db.execute(select(Feature.name, Feature.id).where(Feature.name.in_(chunk))).all())
+    return ids
+
+def sync_platform_features(db, platforms, feature_ids=None):
+    """Rebuild the platform_features rows for the given (flushed) platforms from their features column
+
+    feature_ids is an optional name -> id cache shared across calls in one transaction;
+    it is filled in as features are looked up or created.
+    """
+    names_by_platform = {p.id: set(split_features(p.features)) for p in platforms if p.id is not None}
+    if not names_by_platform:
+        return
+    if feature_ids is None:
+        feature_ids = {}
+
+    names = sorted(set().union(*names_by_platform.values()) - feature_ids.keys())
+    feature_ids.update(_feature_ids_by_name(db, names))
+    missing = [name for name in names if name not in feature_ids]
+    if missing:
+        db.execute(insert(Feature), [{"name": name} for name in missing])
+        feature_ids.update(_feature_ids_by_name(db, missing))
+
+    platform_ids = list(names_by_platform)
+    for start in range(0, len(platform_ids), _IN_CHUNK):
+        chunk = platform_ids[start:start + _IN_CHUNK]
+        db.execute(delete(platform_features).where(platform_features.c.platform_id.in_(chunk)))
+    rows = [
+        {"platform_id": platform_id, "feature_id": feature_ids[name]}
+        for platform_id, feature_names in names_by_platform.items()
+        for name in feature_names
+    ]
+    if rows:
+        db.execute(insert(platform_features), rows)
+
+def upsert(db, table, rows, key_columns, update_values):
+    """INSERT rows, resolving key conflicts with ON CONFLICT DO UPDATE (PostgreSQL and SQLite)
+
+    update_values maps column name to a function of the statement's `excluded`
+    pseudo-table returning the new value, e.g. lambda excluded: excluded.name.
+    """
+    dialects = {"postgresql": postgresql, "sqlite": sqlite}
+    dialect = dialects.get(db.get_bind().dialect.name)
+    if dialect is None:
+        raise NotImplementedError(f"upsert is not supported on {db.get_bind().dialect.name}")
+    table = getattr(table, "__table__", table)
+    stmt = dialect.insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=key_columns,
+        set_={column: value(stmt.excluded) for column, value in update_values.items()}
+    )
+    db.execute(stmt, rows)
+
+def _smoothed_rating(review_count, rating_sum):
+    """Bayesian average as a SQL expression over the given count and sum expressions"""
+    return (rating_sum + RATING_PRIOR_MEAN * RATING_PRIOR_WEIGHT) / (review_count + RATING_PRIOR_WEIGHT)
+
+def apply_platform_ratings(db, increments):
+    """Add review counts and rating sums to the platforms' running aggregates; the caller commits
+
+    increments is a list of {"platform_id", "review_count", "rating_sum"} dicts. Each row
+    is updated relative to its current values, so concurrent writers do not lose counts.
+    """
+    platforms = Platform.__table__
+    new_count = platforms.c.review_count + bindparam("add_count")
+    new_sum = platforms.c.rating_sum + bindparam("add_sum")
+    db.execute(
+        update(platforms)
+        .where(platforms.c.id == bindparam("platform_id"))
+        .values(review_count=new_count, rating_sum=new_sum, bayesian_rating=_smoothed_rating(new_count, new_sum)),
+        [
+            {"platform_id": row["platform_id"], "add_count": row["review_count"], "add_sum": row["rating_sum"]}
+            for row in increments
+        ]
+    )
+
+def apply_review_rollup(db, increments):
+    """Add review counts and rating sums to review_daily_rollup and the platforms' aggregates; the caller commits
+
+    increments is a list of {"platform_id", "day", "review_count", "rating_sum"} dicts
+    with at most one entry per (platform_id, day). The reviews data version is left to
+    the caller, which bumps it once per batch.
+    """
+    rollup = ReviewDailyRollup.__table__
+    upsert(
+        db,
+        rollup,
+        increments,
+        ["platform_id", "day"],
+        {
+            "review_count": lambda excluded: rollup.c.review_count + excluded.review_count,
+            "rating_sum": lambda excluded: rollup.c.rating_sum + excluded.rating_sum,
+        }
+    )
+    per_platform = {}
+    for row in increments:
+        count, rating_sum = per_platform.get(row["platform_id"], (0, 0.0))
+        per_platform[row["platform_id"]] = (count + row["review_count"], rating_sum + row["rating_sum"])
+    apply_platform_ratings(db, [
+        {"platform_id": platform_id, "review_count": count, "rating_sum": rating_sum}
+        for platform_id, (count, rating_sum) in per_platform.items()
+    ])
+
+def fold_reviews_into_rollup(db, rows):
+    """Aggregate review rows (platform_id, rating, created_at) per day, add them to the rollup and bump the reviews version once"""
+    increments = {}
+    for row in rows:
+        key = (row["platform_id"], row["created_at"].date())
+        count, rating_sum = increments.get(key, (0, 0.0))
+        increments[key] = (count + 1, rating_sum + row["rating"])
+    if increments:
+        apply_review_rollup(db, [
+            {"platform_id": platform_id, "day": day, "review_count": count, "rating_sum": rating_sum}
+            for (platform_id, day), (count, rating_sum) in increments.items()
+        ])
+        # Every writer updates this one row, so it is touched once per batch, never per review
+        bump_data_version(db, REVIEWS_SCOPE)
+
+def add_reviews(db, rows):
+    """Insert many review rows with executemany and update the rollup; the caller commits"""
+    if not rows:
+        return
+    db.execute(insert(Review), rows)
+    fold_reviews_into_rollup(db, rows)
+
+def add_review(db, platform_id, user_name, rating, comment, created_at=None):
+    """Insert a review and fold it into review_daily_rollup in the same transaction; the caller commits"""
+    created_at = created_at or datetime.utcnow()
+    review = Review(
+        platform_id=platform_id,
+        user_name=user_name,
+        rating=rating,
+        comment=comment,
+        created_at=created_at
+    )
+    db.add(review)
+    apply_review_rollup(
+        db,
+        [{"platform_id": platform_id, "day": created_at.date(), "review_count": 1, "rating_sum": rating}]
+    )
+    # Last statement before the caller commits, so the shared version row stays locked as briefly as possible
+    bump_data_version(db, REVIEWS_SCOPE)
+    return review
+
+def rebuild_review_rollup(db):
+    """Recompute review_daily_rollup from the reviews table; the caller commits"""
+    day = func.date(Review.created_at)
+    db.execute(delete(ReviewDailyRollup))
+    db.execute(
+        insert(ReviewDailyRollup).from_select(
+            ["platform_id", "day", "review_count", "rating_sum"],
+            select(Review.platform_id, day, func.count(), func.coalesce(func.sum(Review.rating), 0))
+            .where(Review.platform_id.is_not(None), Review.created_at.is_not(None))
+            .group_by(Review.platform_id, day)
+        )
+    )
+    bump_data_version(db, REVIEWS_SCOPE)
+
+def rebuild_platform_ratings(db):
+    """Recompute every platform's review count, rating sum and smoothed rating from the reviews table; the caller commits"""
+    platforms = Platform.__table__
+    review_count = (
+        select(func.count()).where(Review.platform_id == platforms.c.id).scalar_subquery()
+    )
+    rating_sum = (
+        select(func.coalesce(func.sum(Review.rating), 0.0)).where(Review.platform_id == platforms.c.id).scalar_subquery()
+    )
+    db.execute(update(platforms).values(review_count=review_count, rating_sum=rating_sum))
+    db.execute(update(platforms).values(
+        bayesian_rating=_smoothed_rating(platforms.c.review_count, platforms.c.rating_sum)
+    ))
+    bump_data_version(db, REVIEWS_SCOPE)
+
+def get_data_version(db, scope=CATALOG_SCOPE):
+    """Return the current version counter for a scope (0 if never bumped)"""
+    version = db.query(DataVersion.version).filter(DataVersion.scope == scope).scalar()
+    return version or 0
+
+def bump_data_version(db, scope=CATALOG_SCOPE):
+    """Increment the version counter for a scope; the caller commits"""
+    updated = db.query(DataVersion).filter(DataVersion.scope == scope).update(
+        {DataVersion.version: DataVersion.version + 1},
+        synchronize_session=False
+    )
+    if not updated:
+        db.add(DataVersion(scope=scope, version=1))
+
+def init_db(seed_path=None):
+    """Initialize database schema and upsert the seed catalog
+
+    Platforms are matched by name, so re-running updates changed platforms
+    and adds new ones.
+    """
+    from .migrations import run_migrations
+    from .seed import DEFAULT_SEED_PATH, load_platform_records, upsert_platforms
+
+    # Create all tables, then bring existing ones up to the current schema
+    Base.metadata.create_all(bind=get_engine())
+    run_migrations()
 
     db = SessionLocal()
     try:
-        # Check if data already exists
-        if db.query(Platform).first() is None:
-            sample_platforms = [
-                # Existing platforms
-                Platform(
-                    name="Bubble",
-                    operating_system="Web-based",
-                    speed_score=85,
-                    accuracy_score=90,
-                    maintenance_score=88,
-                    price_range="$25-299/mo",
-                    features="Visual Development, API Integration, Database"
-                ),
-                Platform(
-                    name="Webflow",
-                    operating_system="Web-based",
-                    speed_score=90,
-                    accuracy_score=88,
-                    maintenance_score=92,
-                    price_range="$12-212/mo",
-                    features="Visual Design, CMS, Hosting"
-                ),
-                Platform(
-                    name="OutSystems",
-                    operating_system="Windows",
-                    speed_score=95,
-                    accuracy_score=92,
-                    maintenance_score=85,
-                    price_range="$75-499/mo",
-                    features="Enterprise Integration, Mobile Development, AI Capabilities"
-                ),
-                # New platforms
-                Platform(
-                    name="Mendix",
-                    operating_system="Web-based, Windows",
-                    speed_score=92,
-                    accuracy_score=94,
-                    maintenance_score=89,
-                    price_range="$50-1000/mo",
-                    features="Enterprise Development, Cloud Deployment, AI-Assisted Development"
-                ),
-                Platform(
-                    name="Appian",
-                    operating_system="Web-based",
-                    speed_score=88,
-                    accuracy_score=93,
-                    maintenance_score=90,
-                    price_range="$90-1500/mo",
-                    features="Process Automation, Case Management, RPA Integration"
-                ),
-                Platform(
-                    name="Power Apps",
-                    operating_system="Windows, Web-based",
-                    speed_score=87,
-                    accuracy_score=85,
-                    maintenance_score=93,
-                    price_range="$10-40/user/mo",
-                    features="Microsoft Integration, Mobile Apps, Data Connectors"
-                ),
-                Platform(
-                    name="Salesforce Lightning",
-                    operating_system="Web-based",
-                    speed_score=86,
-                    accuracy_score=89,
-                    maintenance_score=94,
-                    price_range="$25-400/user/mo",
-                    features="CRM Integration, Enterprise Apps, Cloud Development"
-                ),
-                Platform(
-                    name="Zoho Creator",
-                    operating_system="Web-based",
-                    speed_score=84,
-                    accuracy_score=86,
-                    maintenance_score=87,
-                    price_range="$15-400/mo",
-                    features="Business Apps, Workflow Automation, Mobile Development"
-                ),
-                Platform(
-                    name="Retool",
-                    operating_system="Web-based",
-                    speed_score=91,
-                    accuracy_score=88,
-                    maintenance_score=86,
-                    price_range="$10-50/user/mo",
-                    features="Internal Tools, Database Integration, Custom Components"
-                ),
-                Platform(
-                    name="AppSheet",
-                    operating_system="Web-based, Mobile",
-                    speed_score=83,
-                    accuracy_score=85,
-                    maintenance_score=88,
-                    price_range="$5-10/user/mo",
-                    features="Mobile Apps, Data Collection, Offline Functionality"
-                ),
-                Platform(
-                    name="Kissflow",
-                    operating_system="Web-based",
-                    speed_score=82,
-                    accuracy_score=84,
-                    maintenance_score=86,
-                    price_range="$10-50/user/mo",
-                    features="Process Management, Project Management, Case Management"
-                ),
-                Platform(
-                    name="Betty Blocks",
-                    operating_system="Web-based",
-                    speed_score=88,
-                    accuracy_score=87,
-                    maintenance_score=85,
-                    price_range="$50-800/mo",
-                    features="Enterprise Apps, Citizen Development, Block-Based Programming"
-                ),
-                Platform(
-                    name="Quickbase",
-                    operating_system="Web-based",
-                    speed_score=87,
-                    accuracy_score=89,
-                    maintenance_score=91,
-                    price_range="$500-1000/mo",
-                    features="Custom Applications, Workflow Automation, Report Generation"
-                ),
-                Platform(
-                    name="Nintex",
-                    operating_system="Web-based, Windows",
-                    speed_score=86,
-                    accuracy_score=90,
-                    maintenance_score=88,
-                    price_range="$900-1500/mo",
-                    features="Process Automation, Document Generation, Forms Management"
-                ),
-                Platform(
-                    name="WaveMaker",
-                    operating_system="Web-based",
-                    speed_score=85,
-                    accuracy_score=86,
-                    maintenance_score=84,
-                    price_range="$99-499/mo",
-                    features="RAD Platform, Enterprise Apps, Docker Deployment"
-                ),
-                Platform(
-                    name="Caspio",
-                    operating_system="Web-based",
-                    speed_score=84,
-                    accuracy_score=85,
-                    maintenance_score=87,
-                    price_range="$100-1000/mo",
-                    features="Database Apps, Web Forms, Report Builder"
-                ),
-                Platform(
-                    name="Alpha Software",
-                    operating_system="Windows, Web-based",
-                    speed_score=83,
-                    accuracy_score=84,
-                    maintenance_score=85,
-                    price_range="$99-399/mo",
-                    features="Mobile Apps, Offline Capability, Database Integration"
-                ),
-                Platform(
-                    name="Knack",
-                    operating_system="Web-based",
-                    speed_score=82,
-                    accuracy_score=83,
-                    maintenance_score=84,
-                    price_range="$39-179/mo",
-                    features="Database Applications, Online Forms, API Access"
-                ),
-                Platform(
-                    name="TrackVia",
-                    operating_system="Web-based",
-                    speed_score=81,
-                    accuracy_score=84,
-                    maintenance_score=83,
-                    price_range="$2000-3000/mo",
-                    features="Workflow Management, Mobile Apps, Custom Dashboards"
-                ),
-                Platform(
-                    name="Airtable",
-                    operating_system="Web-based",
-                    speed_score=89,
-                    accuracy_score=87,
-                    maintenance_score=91,
-                    price_range="$10-20/user/mo",
-                    features="Database Management, Collaboration, API Integration"
-                ),
-                Platform(
-                    name="FileMaker",
-                    operating_system="Windows, MacOS",
-                    speed_score=86,
-                    accuracy_score=88,
-                    maintenance_score=85,
-                    price_range="$19-39/user/mo",
-                    features="Custom Apps, Database Design, Cross-Platform Development"
-                ),
-                Platform(
-                    name="Glide",
-                    operating_system="Web-based",
-                    speed_score=88,
-                    accuracy_score=85,
-                    maintenance_score=89,
-                    price_range="$25-99/mo",
-                    features="Mobile Apps, No-Code Development, Spreadsheet Integration"
-                ),
-                Platform(
-                    name="Oracle APEX",
-                    operating_system="Web-based",
-                    speed_score=91,
-                    accuracy_score=93,
-                    maintenance_score=87,
-                    price_range="Free-1000/mo",
-                    features="Enterprise Development, Database Apps, REST APIs"
-                ),
-                Platform(
-                    name="Directual",
-                    operating_system="Web-based",
-                    speed_score=84,
-                    accuracy_score=86,
-                    maintenance_score=85,
-                    price_range="$29-299/mo",
-                    features="Backend Development, API Creation, Database Management"
-                ),
-                Platform(
-                    name="Adalo",
-                    operating_system="Web-based",
-                    speed_score=83,
-                    accuracy_score=82,
-                    maintenance_score=84,
-                    price_range="$50-200/mo",
-                    features="Mobile App Development, Visual Design, Component Library"
-                ),
-                Platform(
-                    name="Thunkable",
-                    operating_system="Web-based",
-                    speed_score=82,
-                    accuracy_score=81,
-                    maintenance_score=83,
-                    price_range="$13-38/mo",
-                    features="Mobile Apps, Drag-and-Drop Interface, Cross-Platform"
-                ),
-                Platform(
-                    name="Appgyver",
-                    operating_system="Web-based",
-                    speed_score=85,
-                    accuracy_score=84,
-                    maintenance_score=86,
-                    price_range="Free-Enterprise",
-                    features="Progressive Web Apps, Native Apps, Data Integration"
-                ),
-                Platform(
-                    name="Budibase",
-                    operating_system="Web-based",
-                    speed_score=87,
-                    accuracy_score=86,
-                    maintenance_score=88,
-                    price_range="Free-100/mo",
-                    features="Internal Tools, Automation, Self-Hosting"
-                ),
-                Platform(
-                    name="Stackby",
-                    operating_system="Web-based",
-                    speed_score=81,
-                    accuracy_score=82,
-                    maintenance_score=83,
-                    price_range="$5-99/user/mo",
-                    features="Spreadsheet Database, API Integration, Collaboration"
-                ),
-                Platform(
-                    name="Kintone",
-                    operating_system="Web-based",
-                    speed_score=84,
-                    accuracy_score=85,
-                    maintenance_score=86,
-                    price_range="$24-200/user/mo",
-                    features="Business Apps, Process Management, Team Collaboration"
-                ),
-                Platform(
-                    name="Joget DX",
-                    operating_system="Web-based",
-                    speed_score=83,
-                    accuracy_score=84,
-                    maintenance_score=85,
-                    price_range="Free-Enterprise",
-                    features="Process Automation, Mobile Apps, Open Source"
-                )
-            ]
-
-            for platform in sample_platforms:
-                db.add(platform)
-
-            db.commit()
-            print("Sample data initialized successfully!")
+        records = load_platform_records(seed_path or DEFAULT_SEED_PATH)
+        count = upsert_platforms(db, records)
+        db.commit()
+        print(f"Seed data upserted successfully ({count} platforms)!")
     except Exception as e:
         print(f"Error initializing database: {str(e)}")
         db.rollback()
@@ -0,0 +1,226 @@
+import atexit
+import io
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+from sqlalchemy import select, tuple_
+
+from .database import ReadSessionLocal, Platform, Review
+
+# Total size of the prepared export files kept on disk per process
+EXPORT_CACHE_MB = float(os.getenv('EXPORT_CACHE_MB', '512'))
+
+# Rows produced per chunk for large exports
+EXPORT_CHUNK_ROWS = int(os.getenv('EXPORT_CHUNK_ROWS', '10000'))
+
+EXPORT_FORMATS = {
+    'csv': ('csv', 'text/csv'),
+    'parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'arrow': ('arrow', 'application/vnd.apache.arrow.stream'),
+}
+
+
+def available_formats():
+    """Export formats usable in this environment; Parquet and Arrow need pyarrow"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return ['csv']
+    return list(EXPORT_FORMATS)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands out what was written since the last drain"""
+
+    def __init__(self):
+        self._parts = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b''.join(self._parts)
+        self._parts = []
+        return data
+
+
+def iter_export(frames, fmt):
+    """Encode an iterable of DataFrames as a stream of bytes chunks in the given format
+
+    Only one frame (plus the encoder's buffer) is held at a time, so the caller
+    can write the chunks to a response or file without building the whole export.
+    """
+    if fmt == 'csv':
+        header = True
+        for frame in frames:
+            yield frame.to_csv(header=header).encode('utf-8')
+            header = False
+        return
+
+    import pyarrow as pa
+
+    sink = _ChunkSink()
+    writer = None
+    schema = None
+    try:
+        for frame in frames:
+            # Later chunks are coerced to the first chunk's schema (e.g. an all-null column)
+            table = pa.Table.from_pandas(frame, schema=schema, preserve_index=True)
+            if writer is None:
+                schema = table.schema
+                if fmt == 'parquet':
+                    import pyarrow.parquet as pq
+                    writer = pq.ParquetWriter(sink, table.schema)
+                else:
+                    writer = pa.ipc.new_stream(sink, table.schema)
+            writer.write_table(table)
+            yield sink.drain()
+    finally:
+        if writer is not None:
+            writer.close()
+    yield sink.drain()
+
+
+def iter_frame_chunks(df, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Slice an in-memory frame into export chunks"""
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+REVIEW_EXPORT_COLUMNS = ['Review_Id', 'Platform', 'User_Name', 'Rating', 'Comment', 'Created_At']
+
+
+def iter_review_frames(platform_name=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Yield reviews one keyset-paginated chunk at a time
+
+    All reviews come in id order. One platform's reviews come newest first,
+    paging on (created_at, id) so each chunk is a range scan of ix_reviews_platform_created.
+    """
+    if platform_name:
+        yield from _iter_platform_review_frames(platform_name, chunk_rows)
+        return
+
+    last_id = 0
+    while True:
+        query = (
+            select(Review.id, Platform.name, Review.user_name, Review.rating, Review.comment, Review.created_at)
+            .join(Platform, Platform.id == Review.platform_id)
+            .where(Review.id > last_id)
+            .order_by(Review.id)
+            .limit(chunk_rows)
+        )
+        db = ReadSessionLocal()
+        try:
+            rows = db.execute(query).all()
+        finally:
+            db.close()
+        if not rows:
+            return
+        yield pd.DataFrame(rows, columns=REVIEW_EXPORT_COLUMNS).set_index('Review_Id')
+        last_id = rows[-1][0]
+
+
+def _iter_platform_review_frames(platform_name, chunk_rows):
+    db = ReadSessionLocal()
+    try:
+        platform_id = db.execute(select(Platform.id).where(Platform.name == platform_name)).scalar()
+    finally:
+        db.close()
+    if platform_id is None:
+        return
+
+    cursor = None
+    while True:
+        query = (
+            select(Review.id, Review.user_name, Review.rating, Review.comment, Review.created_at)
+            .where(Review.platform_id == platform_id)
+            .order_by(Review.created_at.desc(), Review.id.desc())
+            .limit(chunk_rows)
+        )
+        if cursor is not None:
+            query = query.where(tuple_(Review.created_at, Review.id) < tuple_(*cursor))
+        db = ReadSessionLocal()
+        try:
+            rows = db.execute(query).all()
+        finally:
+            db.close()
+        if not rows:
+            return
+        frame = pd.DataFrame(rows, columns=['Review_Id', 'User_Name', 'Rating', 'Comment', 'Created_At'])
+        frame.insert(1, 'Platform', platform_name)
+        yield frame.set_index('Review_Id')
+        cursor = (rows[-1].created_at, rows[-1].id)
+
+
+class ExportCache:
+    """LRU of prepared export files on disk, keyed by export name, format and data version
+
+    Files are written chunk by chunk, so building one holds a single chunk in
+    memory, and the cache is bounded by the files' total size. The file just
+    built is always kept, even when it alone exceeds the bound.
+    """
+
+    def __init__(self, max_bytes=int(EXPORT_CACHE_MB * 1024 * 1024)):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._directory = None
+
+    def get(self, key):
+        """Open binary file of the prepared export, or None; the caller closes it"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            # Opened under the lock, so a concurrent eviction can only unlink an already open file
+            return open(entry[0], 'rb')
+
+    def build(self, key, frames, fmt):
+        """Encode frames into a file, cache it under key and return it opened for reading"""
+        with tempfile.NamedTemporaryFile('wb', dir=self._ensure_directory(), suffix=f'.{fmt}', delete=False) as f:
+            try:
+                for chunk in iter_export(frames, fmt):
+                    f.write(chunk)
+            except BaseException:
+                f.close()
+                os.remove(f.name)
+                raise
+            path, size = f.name, f.tell()
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._remove(previous)
+            self._entries[key] = (path, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                self._remove(self._entries.popitem(last=False)[1])
+            return open(path, 'rb')
+
+    def _remove(self, entry):
+        path, size = entry
+        self.total_bytes -= size
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _ensure_directory(self):
+        with self._lock:
+            if self._directory is None:
+                self._directory = tempfile.mkdtemp(prefix='lcnc_exports_')
+                atexit.register(shutil.rmtree, self._directory, ignore_errors=True)
+            return self._directory
+
+
+export_cache = ExportCache()
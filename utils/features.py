@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+
+def split_features(features):
+    """Tokenize a comma-joined features string into clean feature names"""
+    # NULL features arrive as None, NaN or pd.NA depending on the catalog dtype backend
+    if pd.isna(features) or not features:
+        return []
+    return [f.strip() for f in features.split(',') if f.strip()]
+
+
+class FeatureMatrix:
+    """Bit-packed platform x feature membership matrix
+
+    Row i holds one bit per feature (np.packbits layout), so a platform with
+    F features costs ceil(F / 8) bytes and set queries are bitwise operations
+    over all rows at once.
+    """
+
+    def __init__(self, platforms, features, bits):
+        self.platforms = platforms
+        self.features = features
+        self.feature_index = {name: i for i, name in enumerate(features)}
+        self.bits = bits
+
+    @classmethod
+    def from_feature_lists(cls, platforms, feature_lists):
+        """Build the matrix from per-platform lists of feature names"""
+        features = sorted({f for feature_list in feature_lists for f in feature_list})
+        feature_index = {name: i for i, name in enumerate(features)}
+
+        rows, cols = [], []
+        for row, feature_list in enumerate(feature_lists):
+            for feature in feature_list:
+                rows.append(row)
+                cols.append(feature_index[feature])
+        rows = np.asarray(rows, dtype=np.intp)
+        cols = np.asarray(cols, dtype=np.intp)
+
+        bits = np.zeros((len(platforms), (len(features) + 7) // 8), dtype=np.uint8)
+        # Big-endian bit order within each byte, matching np.packbits/np.unpackbits
+        np.bitwise_or.at(bits, (rows, cols >> 3), (0x80 >> (cols & 7)).astype(np.uint8))
+        return cls(list(platforms), features, bits)
+
+    def mask_for(self, features):
+        """Return the packed query row for a set of features; unknown names raise KeyError"""
+        mask = np.zeros(self.bits.shape[1], dtype=np.uint8)
+        for feature in features:
+            col = self.feature_index[feature]
+            mask[col >> 3] |= 0x80 >> (col & 7)
+        return mask
+
+    def has_all(self, features):
+        """Boolean array over platforms: True where every given feature is present"""
+        mask = self.mask_for(features)
+        return ((self.bits & mask) == mask).all(axis=1)
+
+    def has_any(self, features):
+        """Boolean array over platforms: True where at least one given feature is present"""
+        mask = self.mask_for(features)
+        return (self.bits & mask).any(axis=1)
+
+    def platforms_where(self, selector):
+        """Return the platform names selected by a boolean array from has_all/has_any"""
+        return [self.platforms[i] for i in np.flatnonzero(selector)]
+
+    def to_dense(self):
+        """Unpack to a boolean platform x feature array"""
+        return np.unpackbits(self.bits, axis=1, count=len(self.features)).astype(bool)
+
+    def to_frame(self):
+        """Boolean DataFrame indexed by platform with one column per feature"""
+        return pd.DataFrame(self.to_dense(), index=self.platforms, columns=self.features)
+
+    def iter_frames(self, chunk_rows=1000):
+        """Yield the boolean matrix as DataFrames of at most chunk_rows platforms, unpacking one chunk at a time"""
+        for start in range(0, len(self.platforms), chunk_rows):
+            bits = self.bits[start:start + chunk_rows]
+            dense = np.unpackbits(bits, axis=1, count=len(self.features)).astype(bool)
+            yield pd.DataFrame(dense, index=self.platforms[start:start + chunk_rows], columns=self.features)
@@ -0,0 +1,89 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+# Total size of the serialized figures kept per process, shared by all sessions
+FIGURE_CACHE_MB = float(os.getenv('FIGURE_CACHE_MB', '128'))
+
+# Stored in place of a builder returning None (e.g. a heatmap with no data)
+_NO_FIGURE = ""
+
+
+class FigureCache:
+    """LRU of Plotly figures stored as serialized JSON, bounded by total size
+
+    Keys must capture everything the figure depends on: chart type, parameters
+    and the data version (or a fingerprint of the input frame). Every call
+    returns its own Figure, so a caller that modifies one cannot affect others.
+    """
+
+    def __init__(self, max_bytes=int(FIGURE_CACHE_MB * 1024 * 1024)):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_build(self, key, builder):
+        """Return the cached figure for key, building and storing it on a miss"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if payload is not None:
+            if not payload:
+                return None
+            # Imported here so frame_fingerprint users do not load plotly
+            import plotly.graph_objects as go
+            # The JSON came from a validated figure, so rebuilding skips validation (several times faster)
+            return go.Figure(json.loads(payload), _validate=False)
+
+        fig = builder()
+        payload = fig.to_json() if fig is not None else _NO_FIGURE
+        with self._lock:
+            self.misses += 1
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= len(previous)
+            self._entries[key] = payload
+            self.total_bytes += len(payload)
+            # The figure just built is kept even if it alone exceeds the bound
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+                self.evictions += 1
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+def frame_fingerprint(df, columns):
+    """Stable hash of the columns a chart reads, in row order, so filtered or re-sorted frames get their own cache entries"""
+    if df.empty:
+        return (0, '')
+    row_hashes = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+    return (len(df), hashlib.sha1(row_hashes.tobytes()).hexdigest())
+
+
+figure_cache = FigureCache()
@@ -0,0 +1,178 @@
+import cProfile
+import io
+import json
+import logging
+import pstats
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Stats for the rerun running in this thread/context, and the component currently executing
+_rerun = ContextVar('rerun_stats', default=None)
+_component = ContextVar('component', default=None)
+
+# The profiler of the last rerun that asked for one; a rerun cut short by st.rerun(), st.stop()
+# or an exception never reaches finish_rerun(), so the next profiled rerun switches it off first
+# (only one cProfile profiler may be active at a time on Python 3.12+)
+_active_profiler = None
+_profiler_lock = threading.Lock()
+
+
+class QueryStats:
+    """SQL statement count, rows and time for one scope
+
+    Rows read are counted for ORM session queries, whose results are buffered anyway;
+    rows written come from the driver's row count for INSERT/UPDATE/DELETE.
+    """
+
+    def __init__(self):
+        self.statements = 0
+        self.rows_read = 0
+        self.rows_written = 0
+        self.sql_seconds = 0.0
+        self.wall_seconds = 0.0
+
+    def as_dict(self):
+        return {
+            'statements': self.statements,
+            'rows_read': self.rows_read,
+            'rows_written': self.rows_written,
+            'sql_ms': round(self.sql_seconds * 1000, 2),
+            'wall_ms': round(self.wall_seconds * 1000, 2),
+        }
+
+
+class RerunStats:
+    """Everything measured during one Streamlit rerun"""
+
+    def __init__(self, profile=False):
+        self.total = QueryStats()
+        self.components = {}
+        # Statement text -> executions; a high count for one statement usually means an N+1 loop
+        self.statement_counts = Counter()
+        self.profile_text = None
+        self._profiler = cProfile.Profile() if profile else None
+        self._started = time.perf_counter()
+        if self._profiler:
+            self._profiler.enable()
+
+    def _scopes(self, component):
+        scopes = [self.total]
+        if component is not None:
+            scopes.append(self.components.setdefault(component, QueryStats()))
+        return scopes
+
+    def record(self, statement, seconds, rows_written, component):
+        for scope in self._scopes(component):
+            scope.statements += 1
+            scope.rows_written += rows_written
+            scope.sql_seconds += seconds
+        self.statement_counts[' '.join(statement.split())] += 1
+
+    def record_rows_read(self, rows, component):
+        for scope in self._scopes(component):
+            scope.rows_read += rows
+
+    def finish(self, top=30):
+        global _active_profiler
+        self.total.wall_seconds = time.perf_counter() - self._started
+        if self._profiler:
+            self._profiler.disable()
+            with _profiler_lock:
+                if _active_profiler is self._profiler:
+                    _active_profiler = None
+            out = io.StringIO()
+            pstats.Stats(self._profiler, stream=out).sort_stats('cumulative').print_stats(top)
+            self.profile_text = out.getvalue()
+            self._profiler = None
+
+    def as_dict(self, top_statements=10):
+        return {
+            'total': self.total.as_dict(),
+            'components': {name: stats.as_dict() for name, stats in self.components.items()},
+            'top_statements': [
+                {'count': count, 'statement': statement}
+                for statement, count in self.statement_counts.most_common(top_statements)
+            ],
+        }
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _rerun.get() is not None:
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    rerun = _rerun.get()
+    started = conn.info.get('query_started')
+    if rerun is None or not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    # rowcount is only meaningful for DML; SELECTs report -1 or 0 until fetched and are counted below
+    written = 0
+    if context is not None and (context.isinsert or context.isupdate or context.isdelete):
+        written = max(cursor.rowcount, 0)
+    rerun.record(statement, elapsed, written, _component.get())
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _count_rows_read(orm_execute_state):
+    """Buffer ORM SELECT results to count their rows; streamed (yield_per) results are left alone"""
+    rerun = _rerun.get()
+    options = orm_execute_state.execution_options
+    if rerun is None or not orm_execute_state.is_select or options.get('yield_per') or options.get('stream_results'):
+        return None
+    frozen = orm_execute_state.invoke_statement().freeze()
+    rerun.record_rows_read(len(frozen.data), _component.get())
+    return frozen()
+
+
+def start_rerun(profile=False):
+    """Begin collecting stats for the current rerun, optionally under cProfile"""
+    global _active_profiler
+    if not profile:
+        stats = RerunStats()
+    else:
+        with _profiler_lock:
+            if _active_profiler is not None:
+                _active_profiler.disable()
+            stats = RerunStats(profile)
+            _active_profiler = stats._profiler
+    _rerun.set(stats)
+    return stats
+
+
+def finish_rerun(log=False):
+    """Stop collecting for the current rerun; optionally emit the stats as one structured log line"""
+    stats = _rerun.get()
+    if stats is None:
+        return None
+    stats.finish()
+    _rerun.set(None)
+    if log:
+        logger.info(json.dumps({'event': 'rerun_stats', **stats.as_dict()}))
+    return stats
+
+
+@contextmanager
+def track(component):
+    """Attribute SQL statements and wall time inside the block to a named component"""
+    rerun = _rerun.get()
+    token = _component.set(component)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _component.reset(token)
+        if rerun is not None:
+            rerun.components.setdefault(component, QueryStats()).wall_seconds += time.perf_counter() - started
@@ -0,0 +1,144 @@
+import logging
+from datetime import datetime
+
+from sqlalchemy import inspect, text, update
+
+from .database import (
+    SessionLocal, Platform, Review, SchemaMigration, CATALOG_SCOPE, RATING_PRIOR_MEAN,
+    bump_data_version, sync_platform_features, rebuild_review_rollup, rebuild_platform_ratings
+)
+from .operating_systems import parse_os_mask
+from .pricing import parse_price_range
+from .search import create_search_indexes
+
+logger = logging.getLogger(__name__)
+
+# Platforms loaded per batch when backfilling derived data
+BATCH_SIZE = 1000
+
+
+def add_column_if_missing(db, table, column, ddl_type):
+    """Add a column to an existing table; fresh databases already have it from create_all"""
+    columns = {c['name'] for c in inspect(db.connection()).get_columns(table)}
+    if column not in columns:
+        db.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl_type}"))
+
+
+def for_each_platform_batch(db, columns, fn):
+    """Call fn(db, rows) over all platforms in id order, BATCH_SIZE at a time
+
+    Only the given columns are selected (plus id), so a migration keeps working
+    on databases that have not yet received columns added by later migrations.
+    """
+    last_id = 0
+    while True:
+        batch = (
+            db.query(Platform.id, *columns)
+            .filter(Platform.id > last_id)
+            .order_by(Platform.id)
+            .limit(BATCH_SIZE)
+            .all()
+        )
+        if not batch:
+            return
+        fn(db, batch)
+        last_id = batch[-1].id
+
+
+def _backfill_platform_features(db):
+    """Populate features/platform_features from the comma-joined Platform.features column"""
+    for_each_platform_batch(db, [Platform.features], sync_platform_features)
+    bump_data_version(db, CATALOG_SCOPE)
+
+
+def _set_os_masks(db, rows):
+    """Write the parsed operating system bitmask for a batch of platforms"""
+    db.execute(
+        update(Platform),
+        [{"id": row.id, "os_mask": parse_os_mask(row.operating_system)} for row in rows]
+    )
+
+
+def _add_os_mask(db):
+    """Add Platform.os_mask and parse every operating_system value into it"""
+    add_column_if_missing(db, "platforms", "os_mask", "INTEGER NOT NULL DEFAULT 0")
+    for_each_platform_batch(db, [Platform.operating_system], _set_os_masks)
+    bump_data_version(db, CATALOG_SCOPE)
+
+
+def _set_price_models(db, rows):
+    """Write the parsed price model for a batch of platforms"""
+    updates = []
+    for row in rows:
+        price = parse_price_range(row.price_range)
+        updates.append({
+            "id": row.id,
+            "price_min": price.min_price,
+            "price_max": price.max_price,
+            "price_per_user": price.per_user,
+            "price_unit": price.billing_unit,
+            "price_open_ended": price.open_ended,
+        })
+    db.execute(update(Platform), updates)
+
+
+def _add_price_model(db):
+    """Add the structured price columns and parse every price_range into them"""
+    add_column_if_missing(db, "platforms", "price_min", "FLOAT")
+    add_column_if_missing(db, "platforms", "price_max", "FLOAT")
+    add_column_if_missing(db, "platforms", "price_per_user", "BOOLEAN NOT NULL DEFAULT FALSE")
+    add_column_if_missing(db, "platforms", "price_unit", "VARCHAR")
+    add_column_if_missing(db, "platforms", "price_open_ended", "BOOLEAN NOT NULL DEFAULT FALSE")
+    for_each_platform_batch(db, [Platform.price_range], _set_price_models)
+    bump_data_version(db, CATALOG_SCOPE)
+
+
+def create_index_if_missing(db, table, index_name):
+    """Create a model-declared index on an existing table"""
+    index = next(i for i in table.indexes if i.name == index_name)
+    index.create(db.connection(), checkfirst=True)
+
+
+def _add_review_listing_index(db):
+    """Index reviews by (platform_id, created_at DESC, id DESC) for keyset pagination"""
+    create_index_if_missing(db, Review.__table__, "ix_reviews_platform_created")
+
+
+def _add_platform_ratings(db):
+    """Add the running review aggregates to platforms and fill them from existing reviews"""
+    add_column_if_missing(db, "platforms", "review_count", "INTEGER NOT NULL DEFAULT 0")
+    add_column_if_missing(db, "platforms", "rating_sum", "FLOAT NOT NULL DEFAULT 0")
+    add_column_if_missing(db, "platforms", "bayesian_rating", f"FLOAT NOT NULL DEFAULT {RATING_PRIOR_MEAN}")
+    rebuild_platform_ratings(db)
+
+
+# Ordered (id, function) pairs; each function runs once inside its own transaction
+MIGRATIONS = [
+    ("0001_platform_features", _backfill_platform_features),
+    ("0002_platform_os_mask", _add_os_mask),
+    ("0003_platform_price_model", _add_price_model),
+    ("0004_review_daily_rollup", rebuild_review_rollup),
+    ("0005_review_listing_index", _add_review_listing_index),
+    ("0006_full_text_search", create_search_indexes),
+    ("0007_platform_ratings", _add_platform_ratings),
+]
+
+
+def run_migrations():
+    """Apply pending migrations in order"""
+    db = SessionLocal()
+    try:
+        applied = {migration_id for (migration_id,) in db.query(SchemaMigration.id)}
+        for migration_id, migrate in MIGRATIONS:
+            if migration_id in applied:
+                continue
+            logger.info(f"Applying migration {migration_id}")
+            migrate(db)
+            db.add(SchemaMigration(id=migration_id, applied_at=datetime.utcnow()))
+            db.commit()
+    except Exception as e:
+        logger.error(f"Error applying migrations: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -0,0 +1,49 @@
+import re
+
+# Canonical operating systems; the list position is the bit in a platform's os_mask
+OPERATING_SYSTEMS = ["Web-based", "Windows", "MacOS", "Linux", "Mobile"]
+
+OS_BITS = {name: 1 << i for i, name in enumerate(OPERATING_SYSTEMS)}
+
+# Spellings seen in source data, keyed by lower-cased token
+_ALIASES = {
+    "web-based": "Web-based",
+    "web based": "Web-based",
+    "web": "Web-based",
+    "browser": "Web-based",
+    "windows": "Windows",
+    "win": "Windows",
+    "macos": "MacOS",
+    "mac": "MacOS",
+    "os x": "MacOS",
+    "linux": "Linux",
+    "mobile": "Mobile",
+    "ios": "Mobile",
+    "android": "Mobile",
+}
+
+_SEPARATORS = re.compile(r"[,/;|]")
+
+
+def parse_os_mask(operating_system):
+    """Parse a free-text operating system list (e.g. "Web-based, Windows") into a bitmask
+
+    Unrecognised tokens are ignored rather than guessed at.
+    """
+    if not operating_system:
+        return 0
+    mask = 0
+    for token in _SEPARATORS.split(operating_system):
+        name = _ALIASES.get(token.strip().lower())
+        if name:
+            mask |= OS_BITS[name]
+    return mask
+
+
+def os_mask_for(names):
+    """Combine canonical operating system names into a query bitmask"""
+    mask = 0
+    for name in names:
+        mask |= OS_BITS[name]
+    return mask
+
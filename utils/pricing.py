@@ -0,0 +1,63 @@
+import re
+from collections import namedtuple
+
+# Parsed form of a price_range string such as "$10-40/user/mo"
+PriceModel = namedtuple(
+    "PriceModel",
+    ["min_price", "max_price", "per_user", "billing_unit", "open_ended"]
+)
+
+UNPRICED = PriceModel(None, None, False, None, True)
+
+_FREE = {"free", "$0", "0"}
+# Tiers without a published number; they bound the range from above but carry no price
+_OPEN = {"enterprise", "custom", "contact", "quote", "contact sales"}
+_UNITS = {
+    "mo": "month", "month": "month", "monthly": "month",
+    "yr": "year", "year": "year", "annual": "year", "annually": "year",
+}
+_PER_USER = {"user", "users", "seat", "seats"}
+_NUMBER = re.compile(r"^\$?\s*(\d+(?:[.,]\d+)*)\s*([kK])?$")
+
+
+def _parse_amount(token):
+    """Return (amount, is_open) for one end of a price range"""
+    token = token.strip()
+    lowered = token.lower()
+    if lowered in _FREE:
+        return 0.0, False
+    if lowered in _OPEN:
+        return None, True
+    match = _NUMBER.match(token)
+    if not match:
+        return None, True
+    amount = float(match.group(1).replace(",", ""))
+    if match.group(2):
+        amount *= 1000
+    return amount, False
+
+
+def parse_price_range(price_range):
+    """Parse a free-text price range into a PriceModel
+
+    Handles "$25-299/mo", "Free-1000/mo", "Free-Enterprise", "$10-40/user/mo",
+    "$25-$115/mo" and single prices; anything unrecognised becomes UNPRICED.
+    """
+    if not price_range or not price_range.strip():
+        return UNPRICED
+
+    amounts, *qualifiers = [part.strip() for part in price_range.split("/")]
+    per_user = any(q.lower() in _PER_USER for q in qualifiers)
+    billing_unit = next((_UNITS[q.lower()] for q in qualifiers if q.lower() in _UNITS), None)
+
+    ends = [end for end in amounts.split("-") if end.strip()]
+    if not ends or len(ends) > 2:
+        return UNPRICED
+    low, _ = _parse_amount(ends[0])
+    high, high_open = _parse_amount(ends[-1])
+    if low is None:
+        return UNPRICED
+
+    if billing_unit is None and high is not None and high > 0:
+        billing_unit = "month"
+    return PriceModel(low, high, per_user, billing_unit, high_open or high is None)
@@ -0,0 +1,72 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .cost_engine import normalized_monthly_price
+
+# Ranking criteria, each scaled to [0, 1] with higher meaning better
+RANKING_CRITERIA = ['speed', 'accuracy', 'maintenance', 'price', 'rating']
+
+# Ranked results kept per index, keyed by weight vector and k
+RANKING_CACHE_SIZE = int(os.getenv('RANKING_CACHE_SIZE', '128'))
+
+
+class RankingIndex:
+    """Criteria matrix for one catalog and reviews version, with cached top-k results
+
+    Composite scores are one matrix-vector product over the whole catalog;
+    the top k are picked with argpartition and only those k are sorted.
+    """
+
+    def __init__(self, version, names, criteria):
+        self.version = version
+        self.names = names
+        self.criteria = criteria
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, version, df, ratings):
+        """Build from a catalog frame and a rating per platform name (Series or dict, 1-5 stars)"""
+        if df.empty:
+            return cls(version, [], np.zeros((0, len(RANKING_CRITERIA)), dtype=np.float32))
+        scores = df[['Speed_Score', 'Accuracy_Score', 'Maintenance_Score']].to_numpy(dtype=np.float32) / 100
+
+        # Cheaper is better; unpriced (or unrated) platforms get the median so they are not rewarded or punished
+        price = 1 - normalized_monthly_price(df)
+        rating = df['Platform'].map(ratings).to_numpy(dtype=float) / 5
+        for column in (price, rating):
+            known = ~np.isnan(column)
+            column[~known] = np.median(column[known]) if known.any() else 0.5
+
+        criteria = np.column_stack([scores, price, rating]).astype(np.float32)
+        return cls(version, df['Platform'].tolist(), criteria)
+
+    def top(self, weights, k=10):
+        """The k best platforms for a {criterion: weight} mapping as a DataFrame, best first"""
+        vector = np.array([float(weights.get(c, 0.0)) for c in RANKING_CRITERIA], dtype=np.float32)
+        key = (tuple(vector.tolist()), k)
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return cached
+
+        total = vector.sum()
+        scores = self.criteria @ (vector / total if total > 0 else vector)
+        k = min(k, len(self.names))
+        top = np.argpartition(scores, -k)[-k:] if k > 0 else np.zeros(0, dtype=np.intp)
+        top = top[np.argsort(scores[top], kind='stable')[::-1]]
+
+        result = pd.DataFrame(self.criteria[top], columns=[c.title() for c in RANKING_CRITERIA])
+        result.insert(0, 'Score', scores[top])
+        result.insert(0, 'Platform', [self.names[i] for i in top])
+        result.insert(0, 'Rank', np.arange(1, len(top) + 1))
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > RANKING_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return result
@@ -0,0 +1,203 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+
+from .catalog import invalidate_catalog
+from .database import SessionLocal, Platform, add_review, add_reviews
+
+logger = logging.getLogger(__name__)
+
+# Write-behind is opt-in; without it review submissions commit synchronously
+WRITE_BEHIND_ENABLED = os.getenv('REVIEW_WRITE_BEHIND', '').lower() in ('1', 'true', 'yes')
+QUEUE_MAX_SIZE = int(os.getenv('REVIEW_QUEUE_MAX_SIZE', '1000'))
+FLUSH_BATCH_SIZE = int(os.getenv('REVIEW_QUEUE_BATCH_SIZE', '100'))
+FLUSH_INTERVAL = float(os.getenv('REVIEW_QUEUE_FLUSH_INTERVAL', '1.0'))
+# Batches that fail to commit are appended here in import_reviews.py's JSONL format
+SPOOL_PATH = os.getenv('REVIEW_QUEUE_SPOOL_PATH', 'review_spool.jsonl')
+
+
+class ReviewWriteQueue:
+    """Bounded in-process queue of review submissions flushed by a background worker
+
+    A batch is written when FLUSH_BATCH_SIZE submissions are waiting or
+    FLUSH_INTERVAL seconds have passed, whichever comes first. When the queue
+    is full the submission is written synchronously instead, and a batch the
+    database rejects is spooled to disk for replay with import_reviews.py.
+    """
+
+    def __init__(self, max_size=QUEUE_MAX_SIZE, batch_size=FLUSH_BATCH_SIZE,
+                 flush_interval=FLUSH_INTERVAL, spool_path=SPOOL_PATH):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spool_path = spool_path
+        self._queue = queue.Queue(maxsize=max_size)
+        self._stop = threading.Event()
+        self._platform_ids = {}
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'submitted': 0,
+            'flushed': 0,
+            'dropped': 0,
+            'batches': 0,
+            'overflowed': 0,
+            'spooled': 0,
+            'spool_failed': 0,
+            'flush_seconds_total': 0.0,
+            'last_flush_seconds': 0.0,
+            'max_flush_seconds': 0.0,
+            'max_wait_seconds': 0.0,
+        }
+        self._worker = threading.Thread(target=self._run, name="review-write-behind", daemon=True)
+        self._worker.start()
+
+    def submit(self, platform_name, user_name, rating, comment, created_at=None):
+        """Queue a review; returns False if it had to be written synchronously because the queue was full"""
+        item = {
+            'platform': platform_name,
+            'user_name': user_name,
+            'rating': rating,
+            'comment': comment,
+            'created_at': created_at or datetime.utcnow(),
+            'enqueued_at': time.monotonic(),
+        }
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self._count('overflowed')
+            self._write_now(item)
+            return False
+        self._count('submitted')
+        return True
+
+    def stats(self):
+        """Snapshot of queue depth, throughput and flush latency metrics"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['queue_depth'] = self._queue.qsize()
+        stats['avg_flush_seconds'] = (
+            stats['flush_seconds_total'] / stats['batches'] if stats['batches'] else 0.0
+        )
+        return stats
+
+    def close(self, timeout=10):
+        """Stop accepting work after flushing whatever is still queued"""
+        self._stop.set()
+        self._worker.join(timeout)
+
+    def _count(self, key, amount=1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _run(self):
+        while not (self._stop.is_set() and self._queue.empty()):
+            batch = self._drain()
+            if batch:
+                self._flush(batch)
+
+    def _drain(self):
+        """Collect up to batch_size items, waiting at most flush_interval for the batch to fill"""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _resolve(self, db, items):
+        """Turn queued items into review rows, refreshing the name -> id map on a miss"""
+        if any(item['platform'] not in self._platform_ids for item in items):
+            self._platform_ids = dict(db.query(Platform.name, Platform.id).all())
+        rows = []
+        for item in items:
+            platform_id = self._platform_ids.get(item['platform'])
+            if platform_id is None:
+                logger.warning(f"Dropping queued review for unknown platform {item['platform']!r}")
+                continue
+            rows.append({
+                'platform_id': platform_id,
+                'user_name': item['user_name'],
+                'rating': item['rating'],
+                'comment': item['comment'],
+                'created_at': item['created_at'],
+            })
+        return rows
+
+    def _flush(self, batch):
+        started = time.perf_counter()
+        db = SessionLocal()
+        try:
+            rows = self._resolve(db, batch)
+            add_reviews(db, rows)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error flushing {len(batch)} queued reviews, spooling to {self.spool_path}: {str(e)}")
+            self._spool(batch)
+            return
+        finally:
+            db.close()
+        invalidate_catalog()
+
+        elapsed = time.perf_counter() - started
+        oldest_wait = time.monotonic() - min(item['enqueued_at'] for item in batch)
+        with self._stats_lock:
+            # Only rows that were committed count as flushed
+            self._stats['flushed'] += len(rows)
+            self._stats['dropped'] += len(batch) - len(rows)
+            self._stats['batches'] += 1
+            self._stats['flush_seconds_total'] += elapsed
+            self._stats['last_flush_seconds'] = elapsed
+            self._stats['max_flush_seconds'] = max(self._stats['max_flush_seconds'], elapsed)
+            self._stats['max_wait_seconds'] = max(self._stats['max_wait_seconds'], oldest_wait)
+        logger.info(f"Flushed {len(rows)} queued reviews in {elapsed * 1000:.1f} ms")
+
+    def _write_now(self, item):
+        """Durable fallback for a full queue: commit the review in the caller's thread"""
+        db = SessionLocal()
+        try:
+            platform = db.query(Platform.id).filter(Platform.name == item['platform']).first()
+            if platform:
+                add_review(db, platform.id, item['user_name'], item['rating'], item['comment'], item['created_at'])
+                db.commit()
+                invalidate_catalog()
+        finally:
+            db.close()
+
+    def _spool(self, batch):
+        # Runs on the worker thread; an error here must not end it, or queued reviews would pile up unwritten
+        try:
+            with open(self.spool_path, 'a', encoding='utf-8') as f:
+                for item in batch:
+                    record = {key: value for key, value in item.items() if key != 'enqueued_at'}
+                    record['created_at'] = record['created_at'].isoformat()
+                    f.write(json.dumps(record, default=str) + '\n')
+        except Exception as e:
+            logger.error(f"Error spooling {len(batch)} queued reviews to {self.spool_path}, they are lost: {str(e)}")
+            self._count('spool_failed', len(batch))
+            return
+        self._count('spooled', len(batch))
+
+
+_review_queue = None
+_review_queue_lock = threading.Lock()
+
+
+def get_review_queue():
+    """Return the process-wide write-behind queue, starting its worker on first use"""
+    global _review_queue
+    if _review_queue is None:
+        with _review_queue_lock:
+            if _review_queue is None:
+                _review_queue = ReviewWriteQueue()
+                atexit.register(_review_queue.close)
+    return _review_queue
@@ -0,0 +1,157 @@
+import re
+
+from sqlalchemy import DateTime, text
+
+from .database import ReadSessionLocal
+
+# Text search configuration (PostgreSQL) and tokenizer (SQLite FTS5); both stem English words
+SEARCH_CONFIG = "english"
+FTS5_TOKENIZER = "porter unicode61"
+
+# PostgreSQL: stored tsvector columns with GIN indexes, so ranking reads the stored vector
+_POSTGRESQL_DDL = [
+    f"""ALTER TABLE platforms ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('{SEARCH_CONFIG}', coalesce(name, '') || ' ' || coalesce(features, ''))) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_platforms_search ON platforms USING GIN (search_vector)",
+    f"""ALTER TABLE reviews ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('{SEARCH_CONFIG}', coalesce(comment, ''))) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_reviews_search ON reviews USING GIN (search_vector)",
+]
+
+# SQLite: external-content FTS5 tables kept in step with their source tables by triggers
+_SQLITE_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS platforms_fts USING fts5(
+        name, features, content='platforms', content_rowid='id', tokenize='{FTS5_TOKENIZER}')""",
+    """CREATE TRIGGER IF NOT EXISTS platforms_fts_insert AFTER INSERT ON platforms BEGIN
+        INSERT INTO platforms_fts(rowid, name, features) VALUES (new.id, new.name, new.features);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS platforms_fts_delete AFTER DELETE ON platforms BEGIN
+        INSERT INTO platforms_fts(platforms_fts, rowid, name, features) VALUES ('delete', old.id, old.name, old.features);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS platforms_fts_update AFTER UPDATE OF name, features ON platforms BEGIN
+        INSERT INTO platforms_fts(platforms_fts, rowid, name, features) VALUES ('delete', old.id, old.name, old.features);
+        INSERT INTO platforms_fts(rowid, name, features) VALUES (new.id, new.name, new.features);
+    END""",
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts USING fts5(
+        comment, content='reviews', content_rowid='id', tokenize='{FTS5_TOKENIZER}')""",
+    """CREATE TRIGGER IF NOT EXISTS reviews_fts_insert AFTER INSERT ON reviews BEGIN
+        INSERT INTO reviews_fts(rowid, comment) VALUES (new.id, new.comment);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS reviews_fts_delete AFTER DELETE ON reviews BEGIN
+        INSERT INTO reviews_fts(reviews_fts, rowid, comment) VALUES ('delete', old.id, old.comment);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS reviews_fts_update AFTER UPDATE OF comment ON reviews BEGIN
+        INSERT INTO reviews_fts(reviews_fts, rowid, comment) VALUES ('delete', old.id, old.comment);
+        INSERT INTO reviews_fts(rowid, comment) VALUES (new.id, new.comment);
+    END""",
+]
+
+_PLATFORM_QUERIES = {
+    "postgresql": """
+        SELECT p.name, p.features, ts_rank(p.search_vector, q) AS score
+        FROM platforms p, websearch_to_tsquery(:config, :query) q
+        WHERE p.search_vector @@ q
+        ORDER BY score DESC, p.id
+        LIMIT :limit OFFSET :offset""",
+    # bm25() is lower-is-better, so it is negated to match ts_rank's direction
+    "sqlite": """
+        SELECT p.name, p.features, -bm25(platforms_fts) AS score
+        FROM platforms_fts JOIN platforms p ON p.id = platforms_fts.rowid
+        WHERE platforms_fts MATCH :query
+        ORDER BY score DESC, p.id
+        LIMIT :limit OFFSET :offset""",
+}
+
+_REVIEW_QUERIES = {
+    # Rank and page the matches first so only the page's rows are joined
+    "postgresql": """
+        SELECT r.id, p.name AS platform, r.user_name, r.rating, r.comment, r.created_at, hits.score
+        FROM (
+            SELECT r.id, ts_rank(r.search_vector, q) AS score
+            FROM reviews r, websearch_to_tsquery(:config, :query) q
+            WHERE r.search_vector @@ q
+            ORDER BY score DESC, r.id DESC
+            LIMIT :limit OFFSET :offset
+        ) hits
+        JOIN reviews r ON r.id = hits.id JOIN platforms p ON p.id = r.platform_id
+        ORDER BY hits.score DESC, r.id DESC""",
+    "sqlite": """
+        SELECT r.id, p.name AS platform, r.user_name, r.rating, r.comment, r.created_at, -hits.rank AS score
+        FROM (
+            SELECT rowid, rank FROM reviews_fts
+            WHERE reviews_fts MATCH :query
+            ORDER BY rank, rowid DESC
+            LIMIT :limit OFFSET :offset
+        ) hits
+        JOIN reviews r ON r.id = hits.rowid JOIN platforms p ON p.id = r.platform_id
+        ORDER BY hits.rank, r.id DESC""",
+}
+
+
+def _dialect(db):
+    name = db.get_bind().dialect.name
+    if name not in ("postgresql", "sqlite"):
+        raise NotImplementedError(f"full-text search is not supported on {name}")
+    return name
+
+
+def create_search_indexes(db):
+    """Create the full-text search columns/tables and indexes and index existing rows; the caller commits"""
+    dialect = _dialect(db)
+    for statement in _POSTGRESQL_DDL if dialect == "postgresql" else _SQLITE_DDL:
+        db.execute(text(statement))
+    if dialect == "sqlite":
+        rebuild_search_indexes(db)
+
+
+def rebuild_search_indexes(db):
+    """Re-index every platform and review from the source tables; the caller commits"""
+    if _dialect(db) == "postgresql":
+        db.execute(text("REINDEX INDEX ix_platforms_search"))
+        db.execute(text("REINDEX INDEX ix_reviews_search"))
+    else:
+        db.execute(text("INSERT INTO platforms_fts(platforms_fts) VALUES ('rebuild')"))
+        db.execute(text("INSERT INTO reviews_fts(reviews_fts) VALUES ('rebuild')"))
+
+
+def _fts5_query(query):
+    """Turn free text into an FTS5 query matching every word, without exposing FTS5 operators"""
+    return " ".join(f'"{word}"' for word in re.findall(r"\w+", query))
+
+
+def _search(queries, query, page, page_size):
+    db = ReadSessionLocal()
+    try:
+        dialect = _dialect(db)
+        if dialect == "sqlite":
+            query = _fts5_query(query)
+        if not query.strip():
+            return [], False
+        # Typed so SQLite returns created_at as a datetime, like the ORM queries do
+        statement = text(queries[dialect]).columns(created_at=DateTime)
+        rows = db.execute(statement, {
+            "config": SEARCH_CONFIG,
+            "query": query,
+            "limit": page_size + 1,
+            "offset": (page - 1) * page_size,
+        }).mappings().all()
+    finally:
+        db.close()
+    return [dict(row) for row in rows[:page_size]], len(rows) > page_size
+
+
+def search_platforms(query, page=1, page_size=20):
+    """Full-text search over platform names and features, best match first
+
+    Returns (results, has_more); each result has name, features and score.
+    """
+    return _search(_PLATFORM_QUERIES, query, page, page_size)
+
+
+def search_reviews(query, page=1, page_size=20):
+    """Full-text search over review comments, best match first
+
+    Returns (results, has_more); each result has id, platform, user_name, rating,
+    comment, created_at and score.
+    """
+    return _search(_REVIEW_QUERIES, query, page, page_size)
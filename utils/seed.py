@@ -0,0 +1,108 @@
+import csv
+import json
+import logging
+import os
+import time
+
+from sqlalchemy import select
+
+from .database import (
+    Platform, CATALOG_SCOPE, upsert, sync_platform_features, bump_data_version
+)
+from .operating_systems import parse_os_mask
+from .pricing import parse_price_range
+
+logger = logging.getLogger(__name__)
+
+# Seed catalog shipped with the app
+DEFAULT_SEED_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'platforms.json')
+
+# Platforms upserted per statement batch
+SEED_BATCH_SIZE = 5000
+
+# Columns a seed record provides; everything else on Platform is derived from them
+SEED_COLUMNS = [
+    'name', 'operating_system', 'speed_score', 'accuracy_score',
+    'maintenance_score', 'price_range', 'features'
+]
+
+
+def load_platform_records(path):
+    """Read platform seed records from a .json, .jsonl, .csv or .parquet file"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.json':
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    if extension == '.jsonl':
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    if extension == '.csv':
+        with open(path, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+    if extension == '.parquet':
+        # Parquet needs pandas with pyarrow (or fastparquet) installed
+        import pandas as pd
+        return pd.read_parquet(path).to_dict('records')
+    raise ValueError(f"Unsupported seed file format: {path}")
+
+
+def platform_row(record):
+    """Turn a seed record into a full platforms row, including the columns validators would derive"""
+    features = record.get('features')
+    if isinstance(features, (list, tuple)):
+        features = ', '.join(features)
+    row = {
+        'name': record['name'].strip(),
+        'operating_system': record.get('operating_system'),
+        'speed_score': float(record['speed_score']),
+        'accuracy_score': float(record['accuracy_score']),
+        'maintenance_score': float(record['maintenance_score']),
+        'price_range': record.get('price_range'),
+        'features': features,
+    }
+    price = parse_price_range(row['price_range'])
+    row.update({
+        'os_mask': parse_os_mask(row['operating_system']),
+        'price_min': price.min_price,
+        'price_max': price.max_price,
+        'price_per_user': price.per_user,
+        'price_unit': price.billing_unit,
+        'price_open_ended': price.open_ended,
+    })
+    return row
+
+
+def upsert_platforms(db, records, batch_size=SEED_BATCH_SIZE):
+    """Insert new platforms and update existing ones by name, then resync their features
+
+    Uses INSERT ... ON CONFLICT (name) DO UPDATE; the caller commits.
+    Returns the number of platforms written.
+    """
+    started = time.perf_counter()
+    rows = list({row['name']: row for row in map(platform_row, records)}.values())
+    platforms = Platform.__table__
+    update_columns = [column for column in rows[0] if column != 'name'] if rows else []
+
+    feature_ids = {}
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        upsert(
+            db,
+            platforms,
+            batch,
+            ['name'],
+            {column: (lambda excluded, column=column: excluded[column]) for column in update_columns}
+        )
+        names = [row['name'] for row in batch]
+        written = []
+        for chunk_start in range(0, len(names), 500):
+            written += db.execute(
+                select(Platform.id, Platform.features)
+                .where(Platform.name.in_(names[chunk_start:chunk_start + 500]))
+            ).all()
+        sync_platform_features(db, written, feature_ids)
+
+    if rows:
+        bump_data_version(db, CATALOG_SCOPE)
+    logger.info(f"Upserted {len(rows)} platforms in {time.perf_counter() - started:.2f}s")
+    return len(rows)
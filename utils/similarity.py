@@ -0,0 +1,102 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .cost_engine import normalized_monthly_price
+
+# Share of the combined similarity taken by feature overlap; the rest comes from scores and price
+FEATURE_WEIGHT = 0.5
+
+SCORE_COLUMNS = ['Speed_Score', 'Accuracy_Score', 'Maintenance_Score']
+
+# Neighbours kept per cached list; smaller k are slices of it, larger k are computed uncached
+MAX_CACHED_NEIGHBOURS = 20
+
+# Neighbour lists kept per index, keyed by platform and feature weight
+SIMILARITY_CACHE_SIZE = int(os.getenv('SIMILARITY_CACHE_SIZE', '1024'))
+
+
+class SimilarityIndex:
+    """Per-snapshot arrays for finding the platforms most similar to a given one
+
+    Each platform is described by a score vector (the three scores and a
+    log-scaled monthly price, all in [0, 1]) and its bit-packed feature row.
+    Similarity to one platform is computed against the whole catalog with
+    array operations, and the top MAX_CACHED_NEIGHBOURS of each (platform,
+    feature weight) are kept in a bounded LRU for the lifetime of the snapshot.
+    """
+
+    def __init__(self, names, vectors, bits):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.vectors = vectors
+        self.bits = bits
+        self.feature_counts = np.bitwise_count(bits).sum(axis=1, dtype=np.int32)
+        self._neighbours = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, df, matrix):
+        """Build from a catalog frame and the feature matrix of the same snapshot"""
+        if df.empty:
+            return cls([], np.zeros((0, len(SCORE_COLUMNS) + 1), dtype=np.float32), matrix.bits)
+        scores = df[SCORE_COLUMNS].to_numpy(dtype=np.float32) / 100
+
+        # Unpriced platforms sit at the median price so they are neither near nor far
+        price = normalized_monthly_price(df)
+        priced = ~np.isnan(price)
+        price[~priced] = np.median(price[priced]) if priced.any() else 0.5
+
+        vectors = np.column_stack([scores, price.astype(np.float32)])
+        return cls(df['Platform'].tolist(), vectors, matrix.bits)
+
+    def similarities(self, i, feature_weight=FEATURE_WEIGHT):
+        """Combined, feature (Jaccard) and score similarity of platform i to every platform"""
+        shared = np.bitwise_count(self.bits & self.bits[i]).sum(axis=1, dtype=np.int32)
+        union = self.feature_counts + self.feature_counts[i] - shared
+        jaccard = np.divide(shared, union, out=np.zeros(len(shared), dtype=np.float32), where=union > 0)
+
+        # Euclidean distance scaled so identical vectors score 1 and opposite corners 0
+        distance = np.sqrt(((self.vectors - self.vectors[i]) ** 2).sum(axis=1))
+        score_similarity = 1 - distance / np.sqrt(self.vectors.shape[1])
+
+        combined = feature_weight * jaccard + (1 - feature_weight) * score_similarity
+        return combined, jaccard, score_similarity
+
+    def neighbours(self, name, k=5, feature_weight=FEATURE_WEIGHT):
+        """The k platforms most similar to name as a DataFrame, best first; unknown names raise KeyError"""
+        key = (name, feature_weight)
+        with self._lock:
+            cached = self._neighbours.get(key)
+            if cached is not None:
+                self._neighbours.move_to_end(key)
+        if cached is None or k > MAX_CACHED_NEIGHBOURS:
+            cached = self._top(self.index[name], max(k, MAX_CACHED_NEIGHBOURS), feature_weight)
+            if k <= MAX_CACHED_NEIGHBOURS:
+                with self._lock:
+                    self._neighbours[key] = cached
+                    while len(self._neighbours) > SIMILARITY_CACHE_SIZE:
+                        self._neighbours.popitem(last=False)
+
+        top, combined, jaccard, score_similarity = (values[:k] for values in cached)
+        return pd.DataFrame({
+            'Platform': [self.names[j] for j in top],
+            'Similarity': combined,
+            'Feature_Overlap': jaccard,
+            'Score_Similarity': score_similarity,
+        })
+
+    def _top(self, i, k, feature_weight):
+        """Indices and similarities of the k platforms most similar to platform i, best first"""
+        combined, jaccard, score_similarity = self.similarities(i, feature_weight)
+        combined[i] = -np.inf
+        k = min(k, len(self.names) - 1)
+        if k <= 0:
+            top = np.zeros(0, dtype=np.intp)
+        else:
+            top = np.argpartition(combined, -k)[-k:]
+            top = top[np.argsort(-combined[top], kind='stable')]
+        return top, combined[top], jaccard[top], score_similarity[top]
@@ -0,0 +1,43 @@
+import importlib
+import logging
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+# Imported first thing by main.py, so this approximates process start for the app
+_STARTED = time.perf_counter()
+
+_import_seconds = {}
+_milestones = {}
+
+
+def timed_import(module_name):
+    """Import a module on demand, recording how long its first import took in this process"""
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    elapsed = time.perf_counter() - started
+    _import_seconds.setdefault(module_name, elapsed)
+    logger.info(f"Imported {module_name} in {elapsed * 1000:.1f} ms")
+    return module
+
+
+def mark(milestone):
+    """Record the first time a startup milestone (e.g. "first_paint") is reached"""
+    if milestone not in _milestones:
+        _milestones[milestone] = time.perf_counter() - _STARTED
+        logger.info(f"Startup milestone {milestone} at {_milestones[milestone] * 1000:.1f} ms")
+
+
+def startup_report():
+    """Per-import and milestone timings in milliseconds, slowest imports first"""
+    return {
+        'imports': [
+            {'module': name, 'ms': round(seconds * 1000, 1)}
+            for name, seconds in sorted(_import_seconds.items(), key=lambda item: -item[1])
+        ],
+        'milestones': {name: round(seconds * 1000, 1) for name, seconds in _milestones.items()},
+    }
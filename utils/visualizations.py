@@ -1,11 +1,17 @@
-import plotly.express as px
 import plotly.graph_objects as go
-from utils.database import SessionLocal, Review, Platform
+from utils.database import (
+    ReadSessionLocal, Platform, ReviewDailyRollup, CATALOG_SCOPE, REVIEWS_SCOPE, get_data_version
+)
+from utils.figure_cache import figure_cache, frame_fingerprint
 from datetime import datetime, timedelta
 import pandas as pd
 
 def create_radar_chart(platform_metrics, platform_name):
     """Create radar chart for platform metrics"""
+    key = ('radar', platform_name, tuple(sorted(platform_metrics.items())))
+    return figure_cache.get_or_build(key, lambda: _radar_chart(platform_metrics, platform_name))
+
+def _radar_chart(platform_metrics, platform_name):
     categories = ['Speed', 'Accuracy', 'Maintenance']
     values = [
         platform_metrics['speed'],
@@ -34,6 +40,13 @@ def create_radar_chart(platform_metrics, platform_name):
 
 def create_comparison_bar_chart(df, metric):
     """Create bar chart for comparing platforms on a specific metric"""
+    key = ('bar', metric, frame_fingerprint(df, ['Platform', f'{metric}_Score']))
+    return figure_cache.get_or_build(key, lambda: _comparison_bar_chart(df, metric))
+
+def _comparison_bar_chart(df, metric):
+    # plotly.express is the slowest plotting import; load it only when a chart needs it
+    import plotly.express as px
+
     fig = px.bar(
         df,
         x='Platform',
@@ -50,6 +63,12 @@ def create_comparison_bar_chart(df, metric):
 
 def create_scatter_plot(df):
     """Create scatter plot for speed vs accuracy"""
+    key = ('scatter', frame_fingerprint(df, ['Platform', 'Speed_Score', 'Accuracy_Score']))
+    return figure_cache.get_or_build(key, lambda: _scatter_plot(df))
+
+def _scatter_plot(df):
+    import plotly.express as px
+
     fig = px.scatter(
         df,
         x='Speed_Score',
@@ -65,60 +84,70 @@ def create_scatter_plot(df):
     return fig
 
 def create_review_heatmap(platform_name=None):
-    """Create a heatmap visualization of user reviews"""
-    db = SessionLocal()
+    """Create a heatmap visualization of user reviews from the daily rollup table"""
+    db = ReadSessionLocal()
     try:
         # Calculate date range (last 30 days)
         end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=30)
-
-        # Query reviews
-        query = db.query(Review, Platform)
-        if platform_name:
-            query = query.join(Platform).filter(Platform.name == platform_name)
-        else:
-            query = query.join(Platform)
-
-        reviews = query.filter(Review.created_at >= start_date).all()
-
-        # Prepare data for heatmap
-        data = []
-        for review, platform in reviews:
-            data.append({
-                'Platform': platform.name,
-                'Rating': review.rating,
-                'Day': review.created_at.strftime('%Y-%m-%d')
-            })
-
-        if not data:
-            return None
-
-        df = pd.DataFrame(data)
-
-        # Pivot data for heatmap
-        heatmap_data = df.pivot_table(
-            values='Rating',
-            index='Platform',
-            columns='Day',
-            aggfunc='mean'
-        ).fillna(0)
-
-        # Create heatmap
-        fig = go.Figure(data=go.Heatmap(
-            z=heatmap_data.values,
-            x=heatmap_data.columns,
-            y=heatmap_data.index,
-            colorscale='RdYlGn',
-            hoverongaps=False
-        ))
-
-        fig.update_layout(
-            title='Review Ratings Heat Map (Last 30 Days)',
-            xaxis_title='Date',
-            yaxis_title='Platform',
-            height=400
-        )
+        start_date = (end_date - timedelta(days=30)).date()
 
-        return fig
+        # The figure only changes with new reviews, catalog edits or the window moving a day
+        key = (
+            'heatmap',
+            platform_name,
+            start_date,
+            get_data_version(db, REVIEWS_SCOPE),
+            get_data_version(db, CATALOG_SCOPE)
+        )
+        return figure_cache.get_or_build(key, lambda: _review_heatmap(db, platform_name, start_date))
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def _review_heatmap(db, platform_name, start_date):
+    """Build the heatmap from rollup rows on or after start_date"""
+    # At most platforms x days pre-aggregated rows, however many reviews exist
+    query = (
+        db.query(
+            Platform.name,
+            ReviewDailyRollup.day,
+            ReviewDailyRollup.review_count,
+            ReviewDailyRollup.rating_sum
+        )
+        .join(Platform, Platform.id == ReviewDailyRollup.platform_id)
+        .filter(ReviewDailyRollup.day >= start_date)
+    )
+    if platform_name:
+        query = query.filter(Platform.name == platform_name)
+
+    rows = query.all()
+    if not rows:
+        return None
+
+    df = pd.DataFrame(rows, columns=['Platform', 'Day', 'Count', 'Rating_Sum'])
+    df['Rating'] = df['Rating_Sum'] / df['Count']
+    df['Day'] = df['Day'].astype(str)
+
+    # Pivot data for heatmap; (platform, day) is unique in the rollup
+    heatmap_data = df.pivot(
+        index='Platform',
+        columns='Day',
+        values='Rating'
+    ).sort_index(axis=1).fillna(0)
+
+    # Create heatmap
+    fig = go.Figure(data=go.Heatmap(
+        z=heatmap_data.values,
+        x=heatmap_data.columns,
+        y=heatmap_data.index,
+        colorscale='RdYlGn',
+        hoverongaps=False
+    ))
+
+    fig.update_layout(
+        title='Review Ratings Heat Map (Last 30 Days)',
+        xaxis_title='Date',
+        yaxis_title='Platform',
+        height=400
+    )
+
+    return fig